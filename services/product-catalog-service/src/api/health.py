@@ -21,7 +21,8 @@ router = APIRouter()
 )
 async def health_check():
     """Basic health check endpoint."""
-    return HealthResponse(
+    # Values are trusted, so skip re-validation on this hot probe path
+    return HealthResponse.model_construct(
         status="healthy",
         timestamp=datetime.now(UTC),
     )
@@ -42,7 +43,7 @@ async def readiness_check():
         db_connected = check_database_connection()
 
         if db_connected:
-            return HealthResponse(
+            return HealthResponse.model_construct(
                 status="ready",
                 timestamp=timestamp,
                 database="connected",
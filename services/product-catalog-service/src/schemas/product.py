@@ -3,8 +3,9 @@
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
+from typing import Annotated
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import AfterValidator, BaseModel, Field, HttpUrl
 
 
 class CategoryEnum(str, Enum):
@@ -16,49 +17,53 @@ class CategoryEnum(str, Enum):
     HOME_GOODS = "home_goods"
 
 
+def _strip_non_empty(v: str) -> str:
+    """Validate string fields are not empty after stripping."""
+    v = v.strip()
+    if not v:
+        raise ValueError("Field cannot be empty")
+    return v
+
+
+def _check_price_places(v: Decimal) -> Decimal:
+    """Ensure price has at most 2 decimal places."""
+    if v.as_tuple().exponent < -2:
+        raise ValueError("Price cannot have more than 2 decimal places")
+    return v
+
+
+# Constrained types shared by ProductCreate and ProductUpdate so the
+# validators are built once rather than per model.
+ProductName = Annotated[
+    str, Field(min_length=1, max_length=255), AfterValidator(_strip_non_empty)
+]
+ProductDescription = Annotated[
+    str, Field(min_length=1, max_length=5000), AfterValidator(_strip_non_empty)
+]
+ProductPrice = Annotated[
+    Decimal, Field(gt=0, decimal_places=2), AfterValidator(_check_price_places)
+]
+
+
 class ProductCreate(BaseModel):
     """Schema for creating a new product."""
 
-    name: str = Field(..., min_length=1, max_length=255, description="Product name")
-    description: str = Field(
-        ..., min_length=1, max_length=5000, description="Product description"
-    )
-    price: Decimal = Field(..., gt=0, decimal_places=2, description="Product price")
+    name: ProductName = Field(..., description="Product name")
+    description: ProductDescription = Field(..., description="Product description")
+    price: ProductPrice = Field(..., description="Product price")
     category: CategoryEnum = Field(..., description="Product category")
     image_url: HttpUrl = Field(..., description="URL to product image")
     stock_quantity: int = Field(..., ge=0, description="Initial stock quantity")
 
-    @field_validator("name", "description")
-    @classmethod
-    def validate_strings(cls, v):
-        """Validate string fields are not empty after stripping."""
-        if isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("Field cannot be empty")
-        return v
-
-    @field_validator("price")
-    @classmethod
-    def validate_price(cls, v):
-        """Ensure price has at most 2 decimal places."""
-        if v.as_tuple().exponent < -2:
-            raise ValueError("Price cannot have more than 2 decimal places")
-        return v
-
 
 class ProductUpdate(BaseModel):
     """Schema for updating an existing product."""
 
-    name: str | None = Field(
-        None, min_length=1, max_length=255, description="Product name"
-    )
-    description: str | None = Field(
-        None, min_length=1, max_length=5000, description="Product description"
-    )
-    price: Decimal | None = Field(
-        None, gt=0, decimal_places=2, description="Product price"
+    name: ProductName | None = Field(None, description="Product name")
+    description: ProductDescription | None = Field(
+        None, description="Product description"
     )
+    price: ProductPrice | None = Field(None, description="Product price")
     category: CategoryEnum | None = Field(None, description="Product category")
     image_url: HttpUrl | None = Field(None, description="URL to product image")
     stock_quantity: int | None = Field(None, ge=0, description="Stock quantity")
@@ -66,24 +71,6 @@ class ProductUpdate(BaseModel):
         None, description="Whether product is active/visible"
     )
 
-    @field_validator("name", "description")
-    @classmethod
-    def validate_strings(cls, v):
-        """Validate string fields are not empty after stripping."""
-        if v is not None and isinstance(v, str):
-            v = v.strip()
-            if not v:
-                raise ValueError("Field cannot be empty")
-        return v
-
-    @field_validator("price")
-    @classmethod
-    def validate_price(cls, v):
-        """Ensure price has at most 2 decimal places."""
-        if v is not None and v.as_tuple().exponent < -2:
-            raise ValueError("Price cannot have more than 2 decimal places")
-        return v
-
 
 class ProductResponse(BaseModel):
     """Schema for product response."""
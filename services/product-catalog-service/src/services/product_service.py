@@ -11,6 +11,9 @@ from src.schemas import ProductCreate, ProductUpdate
 
 logger = logging.getLogger(__name__)
 
+# Valid category values, used to reject unknown categories without raising
+_CATEGORY_VALUES = frozenset(c.value for c in ModelCategoryEnum)
+
 
 class ProductService:
     """Service class for product operations."""
@@ -39,6 +42,10 @@ class ProductService:
             Tuple of (products_list, total_count)
 
         """
+        # Invalid category - return empty results before touching the database
+        if category and category not in _CATEGORY_VALUES:
+            return [], 0
+
         query = self.db.query(Product)
 
         # Filter by active status
@@ -47,12 +54,7 @@ class ProductService:
 
         # Filter by category
         if category:
-            try:
-                category_enum = ModelCategoryEnum(category)
-                query = query.filter(Product.category == category_enum)
-            except ValueError:
-                # Invalid category - return empty results
-                return [], 0
+            query = query.filter(Product.category == ModelCategoryEnum(category))
 
         # Search functionality
         if search_query:
@@ -16,10 +16,26 @@ from src.schemas import (
     ProductUpdate,
 )
 
+_LONG_NAME = "x" * 256  # Exceeds 255 character limit
+_LONG_DESC = "x" * 5001  # Exceeds 5000 character limit
+_VALID_URL = "https://example.com/test.jpg"
+
 
 class TestProductCreate:
     """Test ProductCreate schema validation."""
 
+    @pytest.fixture
+    def base_product_data(self):
+        """Valid ProductCreate payload to derive invalid variants from."""
+        return {
+            "name": "Test Product",
+            "description": "Test description",
+            "price": Decimal("29.99"),
+            "category": CategoryEnum.ELECTRONICS,
+            "image_url": _VALID_URL,
+            "stock_quantity": 10,
+        }
+
     def test_valid_product_create(self):
         """Test valid ProductCreate data."""
         data = {
@@ -27,7 +43,7 @@ class TestProductCreate:
             "description": "A test product description",
             "price": Decimal("29.99"),
             "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
+            "image_url": _VALID_URL,
             "stock_quantity": 10,
         }
 
@@ -37,7 +53,7 @@ class TestProductCreate:
         assert product.description == "A test product description"
         assert product.price == Decimal("29.99")
         assert product.category == CategoryEnum.ELECTRONICS
-        assert str(product.image_url) == "https://example.com/test.jpg"
+        assert str(product.image_url) == _VALID_URL
         assert product.stock_quantity == 10
 
     def test_missing_required_fields(self):
@@ -58,182 +74,43 @@ class TestProductCreate:
 
         assert required_fields.issubset(error_fields)
 
-    def test_empty_name(self):
-        """Test ProductCreate with empty name."""
-        data = {
-            "name": "",
-            "description": "Test description",
-            "price": Decimal("29.99"),
-            "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
-            "stock_quantity": 10,
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(**data)
-
-        assert any("cannot be empty" in str(error) for error in exc_info.value.errors())
-
-    def test_whitespace_only_name(self):
-        """Test ProductCreate with whitespace-only name."""
-        data = {
-            "name": "   ",
-            "description": "Test description",
-            "price": Decimal("29.99"),
-            "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
-            "stock_quantity": 10,
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(**data)
-
-        assert any("cannot be empty" in str(error) for error in exc_info.value.errors())
-
-    def test_name_too_long(self):
-        """Test ProductCreate with name exceeding max length."""
-        data = {
-            "name": "x" * 256,  # Exceeds 255 character limit
-            "description": "Test description",
-            "price": Decimal("29.99"),
-            "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
-            "stock_quantity": 10,
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(**data)
-
-        assert any(
-            "ensure this value has at most 255 characters" in str(error)
-            for error in exc_info.value.errors()
-        )
-
-    def test_description_too_long(self):
-        """Test ProductCreate with description exceeding max length."""
-        data = {
-            "name": "Test Product",
-            "description": "x" * 5001,  # Exceeds 5000 character limit
-            "price": Decimal("29.99"),
-            "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
-            "stock_quantity": 10,
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(**data)
-
-        assert any(
-            "ensure this value has at most 5000 characters" in str(error)
-            for error in exc_info.value.errors()
-        )
-
-    def test_negative_price(self):
-        """Test ProductCreate with negative price."""
-        data = {
-            "name": "Test Product",
-            "description": "Test description",
-            "price": Decimal("-10.00"),
-            "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
-            "stock_quantity": 10,
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(**data)
-
-        assert any(
-            "ensure this value is greater than 0" in str(error)
-            for error in exc_info.value.errors()
-        )
-
-    def test_zero_price(self):
-        """Test ProductCreate with zero price."""
-        data = {
-            "name": "Test Product",
-            "description": "Test description",
-            "price": Decimal("0.00"),
-            "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
-            "stock_quantity": 10,
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(**data)
-
-        assert any(
-            "ensure this value is greater than 0" in str(error)
-            for error in exc_info.value.errors()
-        )
-
-    def test_price_too_many_decimals(self):
-        """Test ProductCreate with price having too many decimal places."""
-        data = {
-            "name": "Test Product",
-            "description": "Test description",
-            "price": Decimal("29.999"),  # 3 decimal places
-            "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
-            "stock_quantity": 10,
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(**data)
-
-        assert any(
-            "more than 2 decimal places" in str(error)
-            for error in exc_info.value.errors()
-        )
-
-    def test_invalid_category(self):
-        """Test ProductCreate with invalid category."""
-        data = {
-            "name": "Test Product",
-            "description": "Test description",
-            "price": Decimal("29.99"),
-            "category": "invalid_category",
-            "image_url": "https://example.com/test.jpg",
-            "stock_quantity": 10,
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(**data)
-
-        assert any("Input should be" in str(error) for error in exc_info.value.errors())
-
-    def test_invalid_url(self):
-        """Test ProductCreate with invalid URL."""
-        data = {
-            "name": "Test Product",
-            "description": "Test description",
-            "price": Decimal("29.99"),
-            "category": CategoryEnum.ELECTRONICS,
-            "image_url": "not_a_valid_url",
-            "stock_quantity": 10,
-        }
-
-        with pytest.raises(ValidationError) as exc_info:
-            ProductCreate(**data)
-
-        assert any("URL" in str(error) for error in exc_info.value.errors())
-
-    def test_negative_stock_quantity(self):
-        """Test ProductCreate with negative stock quantity."""
-        data = {
-            "name": "Test Product",
-            "description": "Test description",
-            "price": Decimal("29.99"),
-            "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
-            "stock_quantity": -5,
-        }
+    @pytest.mark.parametrize(
+        ("field", "value", "error_type"),
+        [
+            ("name", "", "string_too_short"),
+            ("name", "   ", "value_error"),
+            ("name", _LONG_NAME, "string_too_long"),
+            ("description", _LONG_DESC, "string_too_long"),
+            ("price", Decimal("-10.00"), "greater_than"),
+            ("price", Decimal("0.00"), "greater_than"),
+            ("price", Decimal("29.999"), "decimal_max_places"),
+            ("category", "invalid_category", "enum"),
+            ("image_url", "not_a_valid_url", "url_parsing"),
+            ("stock_quantity", -5, "greater_than_equal"),
+        ],
+        ids=[
+            "empty_name",
+            "whitespace_only_name",
+            "name_too_long",
+            "description_too_long",
+            "negative_price",
+            "zero_price",
+            "price_too_many_decimals",
+            "invalid_category",
+            "invalid_url",
+            "negative_stock_quantity",
+        ],
+    )
+    def test_invalid_field(self, base_product_data, field, value, error_type):
+        """Test ProductCreate rejects an invalid value for a single field."""
+        data = {**base_product_data, field: value}
 
         with pytest.raises(ValidationError) as exc_info:
             ProductCreate(**data)
 
         assert any(
-            "ensure this value is greater than or equal to 0" in str(error)
-            for error in exc_info.value.errors()
+            e["type"] == error_type and e["loc"] == (field,)
+            for e in exc_info.value.errors()
         )
 
     def test_string_trimming(self):
@@ -243,7 +120,7 @@ class TestProductCreate:
             "description": "  Test description  ",
             "price": Decimal("29.99"),
             "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
+            "image_url": _VALID_URL,
             "stock_quantity": 10,
         }
 
@@ -329,7 +206,7 @@ class TestProductResponse:
             "description": "Test description",
             "price": 29.99,
             "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
+            "image_url": _VALID_URL,
             "stock_quantity": 10,
             "is_active": True,
             "created_at": datetime.now(UTC),
@@ -355,7 +232,7 @@ class TestProductListResponse:
             "description": "Test description",
             "price": 29.99,
             "category": CategoryEnum.ELECTRONICS,
-            "image_url": "https://example.com/test.jpg",
+            "image_url": _VALID_URL,
             "stock_quantity": 10,
             "is_active": True,
             "created_at": datetime.now(UTC),
@@ -423,6 +300,17 @@ class TestHealthResponse:
         assert response.status == "ready"
         assert response.database == "connected"
 
+    def test_model_construct_matches_validated(self):
+        """Test model_construct produces the same payload as validation."""
+        timestamp = datetime.now(UTC)
+
+        constructed = HealthResponse.model_construct(
+            status="healthy", timestamp=timestamp
+        )
+        validated = HealthResponse(status="healthy", timestamp=timestamp)
+
+        assert constructed.model_dump() == validated.model_dump()
+
 
 class TestErrorResponse:
     """Test ErrorResponse schema."""
@@ -0,0 +1,44 @@
+"""Store activity log change details as JSONB with GIN indexes
+
+Tables are created by create_all (startup or scripts/init_db.py); this
+revision upgrades existing PostgreSQL databases. It is a no-op elsewhere.
+
+Revision ID: 001
+Revises:
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in ("old_values", "new_values"):
+        op.execute(
+            f"ALTER TABLE activity_logs "
+            f"ALTER COLUMN {column} TYPE JSONB USING {column}::jsonb"
+        )
+        op.execute(
+            f"CREATE INDEX IF NOT EXISTS ix_activity_logs_{column}_gin "
+            f"ON activity_logs USING GIN ({column})"
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    for column in ("old_values", "new_values"):
+        op.execute(f"DROP INDEX IF EXISTS ix_activity_logs_{column}_gin")
+        op.execute(
+            f"ALTER TABLE activity_logs "
+            f"ALTER COLUMN {column} TYPE JSON USING {column}::json"
+        )
@@ -0,0 +1,30 @@
+"""Replace the activity_logs user_id index with a (user_id, created_at DESC) index
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 12:10:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_activity_logs_user_created "
+        "ON activity_logs (user_id, created_at DESC)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_activity_logs_user_id")
+
+
+def downgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_activity_logs_user_id "
+        "ON activity_logs (user_id)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_activity_logs_user_created")
@@ -0,0 +1,50 @@
+"""Replace the single-column addresses indexes with a composite index and a unique default index
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 12:20:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_addresses_user_type_default "
+        "ON addresses (user_id, address_type, is_default)"
+    )
+    # The old unset-then-insert code could leave two defaults for one user
+    # and type under concurrency; keep the newest and clear the rest so the
+    # unique index below can be built
+    op.execute(
+        "UPDATE addresses SET is_default = false, updated_at = CURRENT_TIMESTAMP "
+        "WHERE is_default AND EXISTS ("
+        "SELECT 1 FROM addresses AS newer "
+        "WHERE newer.user_id = addresses.user_id "
+        "AND newer.address_type = addresses.address_type "
+        "AND newer.is_default "
+        "AND (newer.created_at > addresses.created_at "
+        "OR (newer.created_at = addresses.created_at AND newer.id > addresses.id)))"
+    )
+    # Partial unique index: at most one default address per user and type
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_addresses_user_type_default "
+        "ON addresses (user_id, address_type) WHERE is_default"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_addresses_user_id")
+    op.execute("DROP INDEX IF EXISTS ix_addresses_address_type")
+    op.execute("DROP INDEX IF EXISTS ix_addresses_is_default")
+
+
+def downgrade() -> None:
+    op.execute("CREATE INDEX IF NOT EXISTS ix_addresses_is_default ON addresses (is_default)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_addresses_address_type ON addresses (address_type)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_addresses_user_id ON addresses (user_id)")
+    op.execute("DROP INDEX IF EXISTS uq_addresses_user_type_default")
+    op.execute("DROP INDEX IF EXISTS ix_addresses_user_type_default")
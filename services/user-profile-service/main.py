@@ -8,12 +8,6 @@ It can be run directly with Python or via uvicorn.
 
 import uvicorn
 import logging
-import sys
-from pathlib import Path
-
-# Add src directory to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
 
 from src.config import get_settings
 from src.app import app
@@ -0,0 +1,36 @@
+"""Pre-generated correlation IDs.
+
+Generating a UUID per request costs an ``os.urandom`` call plus string
+formatting. This module amortizes both by generating IDs in batches from a
+single random read and handing them out one at a time.
+"""
+
+import os
+import threading
+import uuid
+from collections import deque
+
+_BATCH_SIZE = 1024
+
+_pool: deque[str] = deque()
+_refill_lock = threading.Lock()
+
+
+def _refill() -> None:
+    """Fill the pool with a new batch of random (version 4) UUID strings."""
+    raw = memoryview(os.urandom(16 * _BATCH_SIZE))
+    _pool.extend(
+        str(uuid.UUID(bytes=raw[i:i + 16].tobytes(), version=4))
+        for i in range(0, len(raw), 16)
+    )
+
+
+def next_correlation_id() -> str:
+    """Return a new random UUID string, equivalent to ``str(uuid.uuid4())``."""
+    while True:
+        try:
+            return _pool.popleft()
+        except IndexError:
+            with _refill_lock:
+                if not _pool:
+                    _refill()
@@ -3,17 +3,19 @@ from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 from fastapi.openapi.utils import get_openapi
 import logging.config
 
-from .config import get_settings
+from .config import get_auth_service, get_settings
 from .database import engine, Base
 from .middleware import setup_middleware
+from .middleware.correlation import install_request_context_filter
 from .middleware.error_handler import setup_exception_handlers
-from .routers import health, profiles, addresses, preferences, activity, admin
+from .services.activity_writer import activity_writer
 
 # Initialize settings
 settings = get_settings()
 
 # Configure logging
 logging.config.dictConfig(settings.get_log_config())
+install_request_context_filter()
 logger = logging.getLogger(__name__)
 
 # Create FastAPI application
@@ -33,19 +35,33 @@ setup_middleware(app)
 # Setup exception handlers
 setup_exception_handlers(app)
 
-# Include routers
-app.include_router(health.router)
-app.include_router(profiles.router)
-app.include_router(addresses.router)
-app.include_router(preferences.router)
-app.include_router(activity.router)
 
-# Include admin router only if enabled
-if settings.enable_admin_endpoints:
-    app.include_router(admin.router)
-    logger.info("Admin endpoints enabled")
-else:
-    logger.info("Admin endpoints disabled")
+def _register_routers(app: FastAPI) -> None:
+    """Import and include routers.
+
+    Imports are deferred so the admin router's schemas and models are only
+    built when admin endpoints are enabled.
+    """
+    from .routers import health, profiles, addresses, preferences, activity
+
+    app.include_router(health.router)
+    app.include_router(profiles.router)
+    app.include_router(addresses.router)
+    app.include_router(preferences.router)
+    app.include_router(activity.router)
+
+    # Include admin router only if enabled
+    if settings.enable_admin_endpoints:
+        from .routers import admin
+
+        app.include_router(admin.router)
+        logger.info("Admin endpoints enabled")
+    else:
+        logger.info("Admin endpoints disabled")
+
+
+# Include routers
+_register_routers(app)
 
 
 # Custom documentation endpoints
@@ -71,6 +87,37 @@ async def redoc_html():
     )
 
 
+# Static OpenAPI metadata, built once at import time
+_OPENAPI_CONTACT = {
+    "name": "Project Zero Team",
+    "email": "support@projectzero.example.com"
+}
+
+_OPENAPI_LICENSE = {
+    "name": "MIT License",
+    "url": "https://opensource.org/licenses/MIT"
+}
+
+_OPENAPI_SERVERS = [
+    {
+        "url": f"http://localhost:{settings.port}",
+        "description": "Local development server"
+    },
+    {
+        "url": "https://api.projectzero.example.com/profile",
+        "description": "Production server"
+    }
+]
+
+_OPENAPI_SECURITY_SCHEMES = {
+    "BearerAuth": {
+        "type": "http",
+        "scheme": "bearer",
+        "bearerFormat": "JWT"
+    }
+}
+
+
 # Custom OpenAPI schema
 def custom_openapi():
     """Generate custom OpenAPI schema."""
@@ -85,36 +132,9 @@ def custom_openapi():
     )
 
     # Add custom metadata
-    openapi_schema["info"]["contact"] = {
-        "name": "Project Zero Team",
-        "email": "support@projectzero.example.com"
-    }
-
-    openapi_schema["info"]["license"] = {
-        "name": "MIT License",
-        "url": "https://opensource.org/licenses/MIT"
-    }
-
-    # Add servers
-    openapi_schema["servers"] = [
-        {
-            "url": f"http://localhost:{settings.port}",
-            "description": "Local development server"
-        },
-        {
-            "url": "https://api.projectzero.example.com/profile",
-            "description": "Production server"
-        }
-    ]
-
-    # Add security schemes
-    openapi_schema["components"]["securitySchemes"] = {
-        "BearerAuth": {
-            "type": "http",
-            "scheme": "bearer",
-            "bearerFormat": "JWT"
-        }
-    }
+    openapi_schema["info"].update(contact=_OPENAPI_CONTACT, license=_OPENAPI_LICENSE)
+    openapi_schema["servers"] = _OPENAPI_SERVERS
+    openapi_schema.setdefault("components", {})["securitySchemes"] = _OPENAPI_SECURITY_SCHEMES
 
     app.openapi_schema = openapi_schema
     return app.openapi_schema
@@ -132,12 +152,18 @@ async def startup_event():
     logger.info(f"Auth Service: {settings.auth_service_url}")
 
     # Create database tables
-    try:
-        Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
-    except Exception as e:
-        logger.error(f"Failed to create database tables: {e}")
-        raise
+    if settings.auto_create_tables:
+        try:
+            Base.metadata.create_all(bind=engine)
+            logger.info("Database tables created successfully")
+        except Exception as e:
+            logger.error(f"Failed to create database tables: {e}")
+            raise
+    else:
+        logger.info("Skipping table creation (AUTO_CREATE_TABLES disabled)")
+
+    # Background writer for buffered activity logs
+    await activity_writer.start()
 
     logger.info(f"Application started successfully on {settings.host}:{settings.port}")
 
@@ -147,7 +173,12 @@ async def shutdown_event():
     """Application shutdown event."""
     logger.info(f"Shutting down {settings.service_name}")
 
-    # Perform cleanup if needed
+    # Flush buffered activity logs before the worker exits
+    await activity_writer.stop()
+
+    # Close pooled connections to the auth service
+    await get_auth_service().aclose()
+
     logger.info("Application shutdown complete")
 
 
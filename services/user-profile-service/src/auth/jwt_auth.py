@@ -1,11 +1,17 @@
+import hashlib
+import threading
+import time
 import jwt
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from fastapi import HTTPException, status
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on the number of verified tokens remembered per JWTAuth instance
+TOKEN_CACHE_MAXSIZE = 4096
+
 
 class JWTAuth:
     """JWT authentication utility class."""
@@ -13,19 +19,55 @@ class JWTAuth:
     def __init__(self, secret_key: str, algorithm: str = "HS256"):
         self.secret_key = secret_key
         self.algorithm = algorithm
+        self._token_cache: "OrderedDict[bytes, Tuple[Dict[str, Any], Optional[float]]]" = OrderedDict()
+        self._token_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _token_cache_key(token: str) -> bytes:
+        """Build a fixed-size cache key so long tokens don't inflate memory."""
+        return hashlib.sha256(token.encode()).digest()[:16]
+
+    def _decode_raw(self, token: str) -> Tuple[Dict[str, Any], Optional[float]]:
+        """Verify the token signature once and return the payload with its expiry.
+
+        Expiration is not enforced here so that callers can decide how to treat
+        expired tokens without paying for a second signature verification.
+        Verified tokens are kept in a bounded LRU cache and evicted once expired.
+        """
+        key = self._token_cache_key(token)
+        with self._token_cache_lock:
+            cached = self._token_cache.get(key)
+            if cached is not None:
+                exp = cached[1]
+                if exp and exp < time.time():
+                    del self._token_cache[key]
+                else:
+                    self._token_cache.move_to_end(key)
+                return cached
+
+        payload = jwt.decode(
+            token,
+            self.secret_key,
+            algorithms=[self.algorithm],
+            options={"verify_exp": False}
+        )
+
+        result = (payload, payload.get('exp'))
+
+        with self._token_cache_lock:
+            self._token_cache[key] = result
+            if len(self._token_cache) > TOKEN_CACHE_MAXSIZE:
+                self._token_cache.popitem(last=False)
+
+        return result
 
     def decode_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Decode and validate a JWT token."""
         try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm]
-            )
+            payload, exp = self._decode_raw(token)
 
             # Check token expiration
-            exp = payload.get('exp')
-            if exp and datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(tz=timezone.utc):
+            if exp and exp < time.time():
                 logger.warning("Token has expired")
                 return None
 
@@ -36,9 +78,6 @@ class JWTAuth:
 
             return payload
 
-        except jwt.ExpiredSignatureError:
-            logger.warning("Token has expired")
-            return None
         except jwt.InvalidTokenError as e:
             logger.warning(f"Invalid token: {str(e)}")
             return None
@@ -72,20 +111,13 @@ class JWTAuth:
     def is_token_expired(self, token: str) -> bool:
         """Check if token is expired without raising an exception."""
         try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm],
-                options={"verify_exp": False}  # Don't verify expiration during decode
-            )
-
-            exp = payload.get('exp')
+            _, exp = self._decode_raw(token)
             if not exp:
                 return True  # No expiration means invalid
 
-            return datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(tz=timezone.utc)
+            return exp < time.time()
 
         except jwt.InvalidTokenError:
             return True  # Invalid token is considered expired
         except Exception:
-            return True  # Any other error is considered expired
\ No newline at end of file
+            return True  # Any other error is considered expired
@@ -1,7 +1,8 @@
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings
 from typing import Optional
 import secrets
-from functools import lru_cache
+from functools import cached_property, lru_cache
 
 from .services.auth_service import AuthService
 
@@ -20,7 +21,7 @@ class Settings(BaseSettings):
     database_url: str = "sqlite:///./user_profile_service.db"
 
     # JWT Configuration
-    jwt_secret_key: str = secrets.token_urlsafe(32)
+    jwt_secret_key: str = Field(default="")
     jwt_algorithm: str = "HS256"
 
     # External Service URLs
@@ -46,8 +47,8 @@ class Settings(BaseSettings):
     ]
 
     # Performance Configuration
-    db_pool_size: int = 5
-    db_max_overflow: int = 10
+    db_pool_size: int = 20
+    db_max_overflow: int = 30
     db_pool_timeout: int = 30
     db_pool_recycle: int = 3600
 
@@ -60,6 +61,16 @@ class Settings(BaseSettings):
     enable_admin_endpoints: bool = True
     enable_activity_logging: bool = True
     enable_preference_validation: bool = True
+    # Build GET responses from database rows without re-validating them;
+    # disable to force full validation (e.g. in tests)
+    trust_orm_responses: bool = True
+    # Let PostgreSQL build JSON list responses (json_agg) where supported.
+    # Off by default: PostgreSQL renders timestamps itself (offset from the
+    # session time zone), so output differs from the response models
+    sql_json_responses: bool = False
+    # Create missing tables at startup; disable in production and run
+    # scripts/init_db.py as a one-time migration step instead
+    auto_create_tables: bool = True
 
     # Health Check Configuration
     health_check_timeout: float = 5.0
@@ -69,6 +80,15 @@ class Settings(BaseSettings):
         env_file_encoding = "utf-8"
         case_sensitive = False
 
+    @model_validator(mode="after")
+    def ensure_jwt_secret_key(self) -> "Settings":
+        """Require an explicit JWT secret in production, generate one otherwise."""
+        if not self.jwt_secret_key:
+            if self.is_production():
+                raise ValueError("JWT_SECRET_KEY must be set in production")
+            self.jwt_secret_key = secrets.token_urlsafe(32)
+        return self
+
     def get_database_url(self) -> str:
         """Get database URL with proper formatting."""
         return self.database_url
@@ -77,8 +97,9 @@ class Settings(BaseSettings):
         """Check if running in production mode."""
         return not self.debug and self.log_level.upper() in ["WARNING", "ERROR", "CRITICAL"]
 
-    def get_cors_origins(self) -> list[str]:
-        """Get CORS allowed origins."""
+    @cached_property
+    def cors_origins(self) -> list[str]:
+        """CORS allowed origins, computed once per settings instance."""
         if self.debug:
             # In debug mode, allow additional development origins
             return self.cors_allow_origins + [
@@ -88,8 +109,18 @@ class Settings(BaseSettings):
             ]
         return self.cors_allow_origins
 
-    def get_log_config(self) -> dict:
-        """Get logging configuration."""
+    @cached_property
+    def cors_origins_set(self) -> frozenset[str]:
+        """CORS allowed origins as a frozenset for O(1) membership checks."""
+        return frozenset(self.cors_origins)
+
+    def get_cors_origins(self) -> list[str]:
+        """Get CORS allowed origins."""
+        return self.cors_origins
+
+    @cached_property
+    def log_config(self) -> dict:
+        """Logging configuration, built once per settings instance."""
         config = {
             "version": 1,
             "disable_existing_loggers": False,
@@ -127,6 +158,10 @@ class Settings(BaseSettings):
         }
         return config
 
+    def get_log_config(self) -> dict:
+        """Get logging configuration."""
+        return self.log_config
+
 
 @lru_cache()
 def get_settings() -> Settings:
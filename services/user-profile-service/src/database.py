@@ -7,7 +7,7 @@ and initialization utilities for the user profile service.
 import os
 from typing import Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from .models.base import Base
@@ -28,15 +28,35 @@ if DATABASE_URL.startswith("sqlite"):
     )
 else:
     # PostgreSQL configuration
+    # Each worker process may open up to pool_size + max_overflow connections;
+    # keep workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) below the server's
+    # max_connections when tuning these per deployment.
     engine = create_engine(
         DATABASE_URL,
-        pool_size=int(os.getenv("DB_POOL_SIZE", "10")),
-        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "20")),
+        pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "30")),
         pool_timeout=int(os.getenv("DB_POOL_TIMEOUT", "30")),
         pool_recycle=3600,  # Recycle connections every hour
+        pool_pre_ping=True,  # Validate connections on checkout
+        pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
         echo=False  # Set to True for SQL debugging
     )
 
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Configure each SQLite connection for concurrent dev/test use.
+
+        WAL lets readers proceed while a write is in progress, and
+        busy_timeout makes writers wait for the lock instead of failing.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.close()
+
 # Create session factory
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -94,18 +114,38 @@ def init_database() -> None:
     create_tables()
 
 
+def _strip_credentials(url: str) -> str:
+    """Drop everything up to the last '@' so credentials are never reported."""
+    return url.split("@")[-1] if "@" in url else url
+
+
+# Connection details never change after import, so sanitize them once
+_SAFE_URL = _strip_credentials(DATABASE_URL)
+_SAFE_ENGINE_URL = _strip_credentials(str(engine.url))
+_POOL_HAS_METRICS = hasattr(engine.pool, "size")
+
+
 def get_database_info() -> dict:
     """Get information about the database connection.
 
     Returns:
         dict: Database connection information
     """
+    if _POOL_HAS_METRICS:
+        pool = engine.pool
+        return {
+            "url": _SAFE_URL,
+            "engine": _SAFE_ENGINE_URL,
+            "pool_size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
     return {
-        "url": DATABASE_URL.split("@")[-1] if "@" in DATABASE_URL else DATABASE_URL,
-        "engine": str(engine.url).split("@")[-1] if "@" in str(engine.url) else str(engine.url),
-        "pool_size": getattr(engine.pool, "size", lambda: "N/A")(),
-        "checked_out": getattr(engine.pool, "checkedout", lambda: "N/A")(),
-        "overflow": getattr(engine.pool, "overflow", lambda: "N/A")(),
+        "url": _SAFE_URL,
+        "engine": _SAFE_ENGINE_URL,
+        "pool_size": "N/A",
+        "checked_out": "N/A",
+        "overflow": "N/A",
     }
 
 
@@ -118,7 +158,7 @@ def check_database_connection() -> bool:
     try:
         with engine.connect() as connection:
             # Simple query to test connection
-            connection.execute("SELECT 1")
+            connection.execute(text("SELECT 1"))
         return True
     except Exception:
         return False
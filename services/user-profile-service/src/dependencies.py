@@ -1,22 +1,60 @@
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
-from typing import Dict, Any
-import uuid
+from typing import Callable, Dict, Any, Optional
+import hashlib
+import time
 
+from cachetools import TLRUCache
+
+from ._uuid_pool import next_correlation_id
+from .database import get_db
+from .middleware import _CID_HEADERS, _IP_HEADERS, first_forwarded_ip
+from .models.user_profile import UserProfile
+from .services.activity_service import ActivityService
+from .services.activity_writer import activity_writer
+from .services.address_service import AddressService
 from .services.auth_service import AuthService
+from .services.preferences_service import PreferencesService
+from .services.profile_service import ProfileService
 from .config import get_auth_service
 
 security = HTTPBearer()
 
+# Verified users by token digest. FastAPI only caches dependencies within a
+# request, so this spares repeat callers the (possibly remote) verification.
+# Keep the TTL short so revoked or expiring tokens are rechecked promptly.
+_TOKEN_CACHE_TTL = 30
+
+
+def _token_cache_expiry(key: bytes, user_data: Dict[str, Any], now: float) -> float:
+    """Expire entries after the TTL, or when the token itself expires if sooner."""
+    ttl = _TOKEN_CACHE_TTL
+    exp = user_data.get("exp")
+    if exp:
+        # exp is wall-clock time, the cache timer is monotonic
+        ttl = min(ttl, exp - time.time())
+    return now + ttl
+
+
+_TOKEN_CACHE: TLRUCache = TLRUCache(maxsize=10_000, ttu=_token_cache_expiry)
+
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     auth_service: AuthService = Depends(get_auth_service)
 ) -> Dict[str, Any]:
     """Get current authenticated user from JWT token."""
+    token = credentials.credentials
+    key = hashlib.blake2s(token.encode(), digest_size=16).digest()
+    cached = _TOKEN_CACHE.get(key)
+    if cached is not None:
+        return cached
+
     try:
-        user_data = await auth_service.verify_token(credentials.credentials)
+        user_data = await auth_service.verify_token(token)
+        # Only successful verifications are cached; failures raise above
+        _TOKEN_CACHE[key] = user_data
         return user_data
     except HTTPException:
         raise
@@ -40,30 +78,61 @@ async def require_admin(
     return current_user
 
 
+# Request-scoped services: FastAPI caches each dependency per request, so a
+# service is built once however many handlers and dependencies use it, and
+# tests can swap one out through app.dependency_overrides.
+def get_profile_service(db: Session = Depends(get_db)) -> ProfileService:
+    return ProfileService(db)
+
+
+def get_address_service(db: Session = Depends(get_db)) -> AddressService:
+    return AddressService(db)
+
+
+def get_preferences_service(db: Session = Depends(get_db)) -> PreferencesService:
+    return PreferencesService(db)
+
+
+def get_activity_service(db: Session = Depends(get_db)) -> ActivityService:
+    return ActivityService(db)
+
+
+def get_current_profile(
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    profile_service: ProfileService = Depends(get_profile_service)
+) -> Optional[UserProfile]:
+    """Get the current user's profile, or None if they have not created one.
+
+    Resolved at most once per request, however many dependants ask for it.
+    """
+    return profile_service.get_profile_by_user_id(current_user["user_id"])
+
+
 def get_request_context(request: Request) -> Dict[str, Any]:
     """Extract request context for logging and audit purposes."""
     # Get client IP address
+    headers = request.headers
     ip_address = request.client.host if request.client else None
-    if not ip_address and hasattr(request, 'headers'):
+    if not ip_address:
         # Check for forwarded IP in common proxy headers
-        ip_address = (
-            request.headers.get('x-forwarded-for') or
-            request.headers.get('x-real-ip') or
-            request.headers.get('cf-connecting-ip')
-        )
-        if ip_address and ',' in ip_address:
-            # Take the first IP if there are multiple
-            ip_address = ip_address.split(',')[0].strip()
+        for key in _IP_HEADERS:
+            ip_address = headers.get(key)
+            if ip_address:
+                # Take the first IP if there are multiple
+                ip_address = first_forwarded_ip(ip_address)
+                break
 
     # Get user agent
-    user_agent = request.headers.get('user-agent')
+    user_agent = headers.get('user-agent')
 
     # Get or generate correlation ID
-    correlation_id = (
-        request.headers.get('x-correlation-id') or
-        request.headers.get('x-request-id') or
-        str(uuid.uuid4())
-    )
+    correlation_id = None
+    for key in _CID_HEADERS:
+        correlation_id = headers.get(key)
+        if correlation_id:
+            break
+    else:
+        correlation_id = next_correlation_id()
 
     return {
         "ip_address": ip_address,
@@ -72,4 +141,48 @@ def get_request_context(request: Request) -> Dict[str, Any]:
         "method": request.method,
         "url": str(request.url),
         "path": request.url.path
-    }
\ No newline at end of file
+    }
+
+# log(user_id, entity_type, description, entity_id=None, activity_type="admin_access")
+AdminAccessLogger = Callable[..., None]
+
+
+def get_admin_access_logger(
+    current_user: Dict[str, Any] = Depends(require_admin),
+    request_context: Dict[str, Any] = Depends(get_request_context),
+    db: Session = Depends(get_db)
+) -> AdminAccessLogger:
+    """Get a function recording an admin's action on a user's data.
+
+    ``description`` may use ``{email}`` for the admin's email. Rows go to the
+    background activity writer, so logging stays off the response path.
+    """
+    def log(
+        user_id: int,
+        entity_type: str,
+        description: str,
+        entity_id: Optional[int] = None,
+        activity_type: str = "admin_access"
+    ) -> None:
+        activity_writer.submit(
+            db,
+            user_id=user_id,
+            activity_type=activity_type,
+            description=description.format(email=current_user["email"]),
+            entity_type=entity_type,
+            entity_id=entity_id,
+            ip_address=request_context.get("ip_address"),
+            user_agent=request_context.get("user_agent"),
+            correlation_id=request_context.get("correlation_id")
+        )
+
+    return log
+
+
+# Shared dependency markers so every route resolves the same cached
+# dependency within a request
+CurrentUser = Depends(get_current_user)
+AdminUser = Depends(require_admin)
+CurrentProfile = Depends(get_current_profile)
+RequestContext = Depends(get_request_context)
+AdminAccessLog = Depends(get_admin_access_logger)
@@ -1,28 +1,65 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import URL, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import time
-import uuid
 import logging
 
+from .._uuid_pool import next_correlation_id
+from .correlation import bind_request_context, reset_request_context
+from ..config import get_settings
+
 logger = logging.getLogger(__name__)
 
+# Candidate headers, in order of precedence
+_IP_HEADERS = ("x-forwarded-for", "x-real-ip", "cf-connecting-ip")
+_CID_HEADERS = ("x-correlation-id", "x-request-id")
+
+# Raw (lowercase bytes) request headers read by UnifiedMiddleware, mapped
+# to the str keys used for lookups
+_WANTED_HEADERS = {
+    name.encode("latin-1"): name
+    for name in (*_IP_HEADERS, *_CID_HEADERS, "user-agent", "content-type")
+}
+
+
+def first_forwarded_ip(value: str) -> str:
+    """Return the first (client) address from an X-Forwarded-For style value."""
+    i = value.find(",")
+    return (value if i < 0 else value[:i]).strip()
+
+
+# Security headers added to every response, pre-encoded for the raw ASGI
+# header list
+_STATIC_SEC_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+    (b"permissions-policy", b"geolocation=(), microphone=(), camera=()"),
+)
+_HSTS = (b"strict-transport-security", b"max-age=31536000; includeSubDomains")
+
+
+# Origins always allowed in addition to the configured CORS origins
+DEFAULT_CORS_ORIGINS = frozenset({
+    "http://localhost:3000",  # React development server
+    "http://localhost:8000",  # API Gateway development
+    "http://localhost:8001",  # Auth service
+    "http://localhost:8008",  # Order service
+    "https://api.projectzero.example.com",  # Production API
+    "https://app.projectzero.example.com",  # Production frontend
+})
+
 
 def setup_cors_middleware(app: FastAPI):
     """Configure CORS middleware."""
+    # Starlette checks `origin in allow_origins` per request, so hand it a
+    # frozenset to keep that check constant-time
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=[
-            "http://localhost:3000",  # React development server
-            "http://localhost:8000",  # API Gateway development
-            "http://localhost:8001",  # Auth service
-            "http://localhost:8008",  # Order service
-            "https://api.projectzero.example.com",  # Production API
-            "https://app.projectzero.example.com",  # Production frontend
-        ],
+        allow_origins=DEFAULT_CORS_ORIGINS | get_settings().cors_origins_set,
         allow_credentials=True,
         allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
         allow_headers=[
@@ -55,136 +92,137 @@ def setup_trusted_host_middleware(app: FastAPI):
     )
 
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle correlation IDs for request tracing."""
-
-    async def dispatch(self, request: Request, call_next):
-        # Get or generate correlation ID
-        correlation_id = (
-            request.headers.get("x-correlation-id") or
-            request.headers.get("x-request-id") or
-            str(uuid.uuid4())
-        )
-
-        # Add correlation ID to request state
-        request.state.correlation_id = correlation_id
-
-        # Process request
-        response = await call_next(request)
-
-        # Add correlation ID to response headers
-        response.headers["X-Correlation-ID"] = correlation_id
+class UnifiedMiddleware:
+    """Pure ASGI middleware for correlation IDs, request logging and security headers.
 
-        return response
+    Handles in a single pass what used to be three ``BaseHTTPMiddleware``
+    subclasses, avoiding the extra task and send/receive tunnel each of them
+    added per request.
+    """
 
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for request/response logging."""
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    def __init__(self, app, log_level: str = "INFO"):
-        super().__init__(app)
-        self.log_level = log_level.upper()
+        start_time = time.perf_counter()
 
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+        # Collect the headers we need in one scan of the raw header list
+        headers = {}
+        for name, value in scope["headers"]:
+            key = _WANTED_HEADERS.get(name)
+            if key and key not in headers:
+                headers[key] = value.decode("latin-1")
 
-        # Get correlation ID from previous middleware
-        correlation_id = getattr(request.state, 'correlation_id', str(uuid.uuid4()))
-
-        # Log request
-        logger.info(
-            f"Request started",
-            extra={
-                "correlation_id": correlation_id,
-                "method": request.method,
-                "url": str(request.url),
-                "path": request.url.path,
-                "client_ip": self._get_client_ip(request),
-                "user_agent": request.headers.get("user-agent"),
-                "content_type": request.headers.get("content-type")
-            }
-        )
-
-        # Process request
-        try:
-            response = await call_next(request)
-            process_time = time.time() - start_time
-
-            # Log response
+        # Get or generate correlation ID
+        correlation_id = None
+        for key in _CID_HEADERS:
+            correlation_id = headers.get(key)
+            if correlation_id:
+                break
+        else:
+            correlation_id = next_correlation_id()
+
+        # Add correlation ID and request start time to request state
+        state = scope.setdefault("state", {})
+        state["correlation_id"] = correlation_id
+        state["t0"] = start_time
+
+        method = scope["method"]
+        path = scope["path"]
+
+        # Correlation ID, method and path reach every log record through
+        # RequestContextFilter, so log calls below only pass their own fields
+        context_tokens = bind_request_context(correlation_id, method, path)
+
+        # Log request (skip building the extra fields when INFO is disabled)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                f"Request completed",
+                "Request started %s %s",
+                method,
+                path,
                 extra={
-                    "correlation_id": correlation_id,
-                    "method": request.method,
-                    "path": request.url.path,
-                    "status_code": response.status_code,
-                    "process_time_seconds": round(process_time, 4),
-                    "content_length": response.headers.get("content-length")
+                    "url": str(URL(scope=scope)),
+                    "client_ip": self._get_client_ip(scope, headers),
+                    "user_agent": headers.get("user-agent"),
+                    "content_type": headers.get("content-type")
                 }
             )
 
-            # Add performance headers
-            response.headers["X-Process-Time"] = str(round(process_time, 4))
-
-            return response
+        is_https = scope.get("scheme") == "https"
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start":
+                process_time = time.perf_counter() - start_time
+                response_headers = MutableHeaders(scope=message)
+
+                # Log response
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "Request completed status=%d path=%s dur=%.4f",
+                        message["status"],
+                        path,
+                        process_time,
+                        extra={
+                            "status_code": message["status"],
+                            "process_time_seconds": round(process_time, 4),
+                            "content_length": response_headers.get("content-length")
+                        }
+                    )
+
+                # Add correlation ID and performance headers (error handlers
+                # may already have set the correlation ID, so replace it)
+                response_headers["X-Correlation-ID"] = correlation_id
+                response_headers["X-Process-Time"] = f"{process_time:.4f}"
+
+                # Add security headers
+                raw_headers = response_headers.raw
+                raw_headers.extend(_STATIC_SEC_HEADERS)
+
+                # Add HSTS header for HTTPS requests
+                if is_https:
+                    raw_headers.append(_HSTS)
+
+            await send(message)
 
+        try:
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            process_time = time.time() - start_time
+            process_time = time.perf_counter() - start_time
 
             # Log error
             logger.error(
-                f"Request failed",
+                "Request failed: %s",
+                type(e).__name__,
                 extra={
-                    "correlation_id": correlation_id,
-                    "method": request.method,
-                    "path": request.url.path,
                     "error": str(e),
-                    "error_type": type(e).__name__,
                     "process_time_seconds": round(process_time, 4)
                 },
                 exc_info=True
             )
 
             raise
+        finally:
+            reset_request_context(context_tokens)
 
-    def _get_client_ip(self, request: Request) -> str:
+    @staticmethod
+    def _get_client_ip(scope: Scope, headers: dict) -> str:
         """Extract client IP address from request."""
         # Check for forwarded IP in common proxy headers
-        forwarded_for = request.headers.get("x-forwarded-for")
-        if forwarded_for:
-            # Take the first IP if there are multiple
-            return forwarded_for.split(",")[0].strip()
-
-        real_ip = request.headers.get("x-real-ip")
-        if real_ip:
-            return real_ip
-
-        cf_connecting_ip = request.headers.get("cf-connecting-ip")
-        if cf_connecting_ip:
-            return cf_connecting_ip
+        for key in _IP_HEADERS:
+            value = headers.get(key)
+            if value:
+                if key == "x-forwarded-for":
+                    # Take the first IP if there are multiple
+                    return first_forwarded_ip(value)
+                return value
 
         # Fallback to client host
-        return request.client.host if request.client else "unknown"
-
-
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
-    """Middleware to add security headers."""
-
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
-
-        # Add security headers
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = "geolocation=(), microphone=(), camera=()"
-
-        # Add HSTS header for HTTPS requests
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-
-        return response
+        client = scope.get("client")
+        return client[0] if client else "unknown"
 
 
 def setup_middleware(app: FastAPI):
@@ -195,7 +233,5 @@ def setup_middleware(app: FastAPI):
     # CORS middleware
     setup_cors_middleware(app)
 
-    # Custom middleware (order matters)
-    app.add_middleware(SecurityHeadersMiddleware)
-    app.add_middleware(RequestLoggingMiddleware)
-    app.add_middleware(CorrelationIDMiddleware)
\ No newline at end of file
+    # Correlation IDs, request logging and security headers
+    app.add_middleware(UnifiedMiddleware)
\ No newline at end of file
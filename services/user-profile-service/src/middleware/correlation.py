@@ -1,54 +1,59 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-import uuid
 import logging
+from contextvars import ContextVar, Token
+from typing import Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Correlation ID and (method, path) of the request being handled in the
+# current context
+_correlation_id: ContextVar[str] = ContextVar("correlation_id", default="-")
+_request_meta: ContextVar[Optional[Tuple[str, str]]] = ContextVar("request_meta", default=None)
 
-class CorrelationIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to handle correlation IDs for distributed tracing."""
 
-    def __init__(self, app, header_name: str = "X-Correlation-ID"):
-        super().__init__(app)
-        self.header_name = header_name
+class RequestContextFilter(logging.Filter):
+    """Attach the current request's correlation ID, method and path to log records.
 
-    async def dispatch(self, request: Request, call_next):
-        # Get correlation ID from headers or generate new one
-        correlation_id = (
-            request.headers.get(self.header_name.lower()) or
-            request.headers.get("x-request-id") or
-            request.headers.get("x-trace-id") or
-            str(uuid.uuid4())
-        )
+    Fields passed explicitly via ``extra=`` take precedence, so call sites
+    running outside a request context can still supply them.
+    """
 
-        # Store correlation ID in request state
-        request.state.correlation_id = correlation_id
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "correlation_id"):
+            record.correlation_id = _correlation_id.get()
+        meta = _request_meta.get()
+        if meta is not None and not hasattr(record, "method"):
+            record.method, record.path = meta
+        return True
 
-        # Add to logging context
-        old_factory = logging.getLogRecordFactory()
 
-        def record_factory(*args, **kwargs):
-            record = old_factory(*args, **kwargs)
-            record.correlation_id = correlation_id
-            return record
+_request_context_filter = RequestContextFilter()
 
-        logging.setLogRecordFactory(record_factory)
 
-        try:
-            # Process the request
-            response = await call_next(request)
+def install_request_context_filter() -> None:
+    """Add the request context filter to every root logger handler.
 
-            # Add correlation ID to response headers
-            response.headers[self.header_name] = correlation_id
+    Handler filters see records propagated from all loggers, unlike logger
+    filters, so this covers application, uvicorn and sqlalchemy logs alike.
+    Call after logging has been configured.
+    """
+    for handler in logging.getLogger().handlers:
+        if _request_context_filter not in handler.filters:
+            handler.addFilter(_request_context_filter)
 
-            return response
 
-        finally:
-            # Restore original log record factory
-            logging.setLogRecordFactory(old_factory)
+def bind_request_context(
+    correlation_id: str, method: Optional[str] = None, path: Optional[str] = None
+) -> Tuple[Token, Optional[Token]]:
+    """Bind request metadata for log records emitted in the current context."""
+    cid_token = _correlation_id.set(correlation_id)
+    meta_token = _request_meta.set((method, path)) if method is not None else None
+    return cid_token, meta_token
 
 
-def get_correlation_id(request: Request) -> str:
-    """Get correlation ID from request state."""
-    return getattr(request.state, 'correlation_id', str(uuid.uuid4()))
\ No newline at end of file
+def reset_request_context(tokens: Tuple[Token, Optional[Token]]) -> None:
+    """Undo a previous ``bind_request_context`` call."""
+    cid_token, meta_token = tokens
+    if meta_token is not None:
+        _request_meta.reset(meta_token)
+    _correlation_id.reset(cid_token)
+
@@ -3,40 +3,37 @@ from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from sqlalchemy.exc import SQLAlchemyError
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 from typing import Union
 
-from ..schemas.error import ErrorResponse, ValidationErrorResponse, ValidationErrorDetail
+from ..schemas.error import ErrorResponse, ValidationErrorDetail, ValidationErrorResponse
 
 logger = logging.getLogger(__name__)
 
 
+def _now_iso() -> str:
+    """Current UTC time in the ISO 8601 form Pydantic emits for timestamps."""
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
     """Handle FastAPI HTTP exceptions."""
     correlation_id = getattr(request.state, 'correlation_id', None)
 
     # Log the exception
-    logger.warning(
-        f"HTTP Exception: {exc.status_code} - {exc.detail}",
-        extra={
-            "correlation_id": correlation_id,
-            "method": request.method,
-            "path": request.url.path,
-            "status_code": exc.status_code,
-            "detail": exc.detail
-        }
-    )
-
-    error_response = ErrorResponse(
-        error=f"HTTP {exc.status_code}",
-        message=exc.detail,
-        timestamp=datetime.utcnow()
-    )
+    logger.warning("HTTP Exception: %s - %s", exc.status_code, exc.detail)
 
+    # Most common error path: build the ErrorResponse payload directly
+    # instead of validating and dumping a Pydantic model
     return JSONResponse(
         status_code=exc.status_code,
-        content=error_response.model_dump(mode='json'),
+        content={
+            "error": f"HTTP {exc.status_code}",
+            "message": exc.detail,
+            "details": None,
+            "timestamp": _now_iso()
+        },
         headers={"X-Correlation-ID": correlation_id} if correlation_id else {}
     )
 
@@ -45,33 +42,33 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     """Handle Pydantic validation errors."""
     correlation_id = getattr(request.state, 'correlation_id', None)
 
-    # Extract validation errors
-    validation_errors = []
-    for error in exc.errors():
-        field_path = " -> ".join(str(loc) for loc in error["loc"])
-        validation_errors.append(
-            ValidationErrorDetail(
-                field=field_path,
-                message=error["msg"],
-                value=error.get("input")
-            )
-        )
+    # Extract validation errors as plain dicts, shared by the log record and
+    # the response body
+    validation_errors = [
+        {
+            "field": " -> ".join(str(loc) for loc in error["loc"]),
+            "message": error["msg"],
+            "value": error.get("input")
+        }
+        for error in exc.errors()
+    ]
 
     # Log the validation error
-    logger.warning(
-        f"Validation Error: {len(validation_errors)} field(s) failed validation",
-        extra={
-            "correlation_id": correlation_id,
-            "method": request.method,
-            "path": request.url.path,
-            "validation_errors": [error.model_dump() for error in validation_errors]
-        }
-    )
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Validation Error: %d field(s) failed validation",
+            len(validation_errors),
+            extra={"validation_errors": validation_errors}
+        )
 
-    error_response = ValidationErrorResponse(
+    # The details are already in the ValidationErrorDetail shape, so skip
+    # re-validating them
+    error_response = ValidationErrorResponse.model_construct(
         message=f"Validation failed for {len(validation_errors)} field(s)",
-        validation_errors=validation_errors,
-        timestamp=datetime.utcnow()
+        validation_errors=[
+            ValidationErrorDetail.model_construct(**error) for error in validation_errors
+        ],
+        timestamp=datetime.now(timezone.utc)
     )
 
     return JSONResponse(
@@ -87,14 +84,9 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -
 
     # Log the database error
     logger.error(
-        f"Database Error: {type(exc).__name__}",
-        extra={
-            "correlation_id": correlation_id,
-            "method": request.method,
-            "path": request.url.path,
-            "error_type": type(exc).__name__,
-            "error_message": str(exc)
-        },
+        "Database Error: %s",
+        type(exc).__name__,
+        extra={"error_message": str(exc)},
         exc_info=True
     )
 
@@ -102,7 +94,7 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError) -
         error="Database Error",
         message="A database error occurred while processing your request",
         details={"error_type": type(exc).__name__},
-        timestamp=datetime.utcnow()
+        timestamp=datetime.now(timezone.utc)
     )
 
     return JSONResponse(
@@ -116,9 +108,12 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     """Handle all other exceptions."""
     correlation_id = getattr(request.state, 'correlation_id', None)
 
-    # Log the unexpected error
+    # Log the unexpected error. This handler runs in Starlette's outermost
+    # ServerErrorMiddleware, after the request logging context has been
+    # reset, so request fields are passed explicitly.
     logger.error(
-        f"Unexpected Error: {type(exc).__name__}",
+        "Unexpected Error: %s",
+        type(exc).__name__,
         extra={
             "correlation_id": correlation_id,
             "method": request.method,
@@ -136,7 +131,7 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
             "error_type": type(exc).__name__,
             "correlation_id": correlation_id
         },
-        timestamp=datetime.utcnow()
+        timestamp=datetime.now(timezone.utc)
     )
 
     return JSONResponse(
@@ -4,18 +4,66 @@ This module defines the SQLAlchemy model for activity logging,
 providing an audit trail of significant account activities.
 """
 
+import re
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, JSON, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, JSON, desc, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
 
 if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
     from .user_profile import UserProfile
 
 
+VALID_ACTIVITY_TYPES: frozenset[str] = frozenset({
+    # Profile activities
+    "profile_created",
+    "profile_updated",
+    "profile_viewed",
+
+    # Address activities
+    "address_created",
+    "address_updated",
+    "address_deleted",
+    "address_default_changed",
+
+    # Preference activities
+    "preferences_updated",
+    "notification_settings_changed",
+    "privacy_settings_changed",
+
+    # Authentication activities
+    "profile_access_denied",
+    "admin_access",
+})
+
+VALID_ENTITY_TYPES: frozenset[str] = frozenset({"profile", "address", "preferences"})
+
+SENSITIVE_FIELDS: tuple[str, ...] = (
+    "password", "password_hash", "api_key", "secret", "token",
+    "ssn", "credit_card", "bank_account", "private_key"
+)
+
+# Matches any key containing one of the sensitive field names
+_SENSITIVE_RE = re.compile("|".join(map(re.escape, SENSITIVE_FIELDS)))
+
+# Fields exposed by ActivityLog.to_dict, read in one attrgetter call
+_PUBLIC_FIELDS = (
+    "id", "user_id", "activity_type", "description",
+    "entity_type", "entity_id", "created_at",
+)
+_PUBLIC_GETTER = attrgetter(*_PUBLIC_FIELDS)
+
+# JSONB on PostgreSQL (binary, indexable), plain JSON elsewhere (SQLite)
+ChangeValues = JSON().with_variant(JSONB(), "postgresql")
+
+
 class ActivityLog(Base):
     """Activity log model for audit trail of significant account activities.
 
@@ -38,6 +86,18 @@ class ActivityLog(Base):
     """
 
     __tablename__ = "activity_logs"
+    __table_args__ = (
+        # Per-user timeline ("latest N activities for user X"); also serves
+        # plain user_id lookups through its leading column
+        Index("ix_activity_logs_user_created", "user_id", desc("created_at")),
+        # GIN indexes for audit searches on change details (PostgreSQL only)
+        Index(
+            "ix_activity_logs_old_values_gin", "old_values", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_activity_logs_new_values_gin", "new_values", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -46,8 +106,7 @@ class ActivityLog(Base):
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("user_profiles.user_id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Activity information
@@ -62,8 +121,8 @@ class ActivityLog(Base):
     correlation_id: Mapped[Optional[str]] = mapped_column(String(36), nullable=True)  # UUID v4
 
     # Change details (JSON)
-    old_values: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
-    new_values: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    old_values: Mapped[Optional[Dict[str, Any]]] = mapped_column(ChangeValues, nullable=True)
+    new_values: Mapped[Optional[Dict[str, Any]]] = mapped_column(ChangeValues, nullable=True)
 
     # Audit field
     created_at: Mapped[datetime] = mapped_column(
@@ -85,36 +144,14 @@ class ActivityLog(Base):
 
     def is_valid_activity_type(self) -> bool:
         """Validate that the activity type is from the predefined set."""
-        valid_activity_types = {
-            # Profile activities
-            "profile_created",
-            "profile_updated",
-            "profile_viewed",
-
-            # Address activities
-            "address_created",
-            "address_updated",
-            "address_deleted",
-            "address_default_changed",
-
-            # Preference activities
-            "preferences_updated",
-            "notification_settings_changed",
-            "privacy_settings_changed",
-
-            # Authentication activities
-            "profile_access_denied",
-            "admin_access",
-        }
-        return self.activity_type in valid_activity_types
+        return self.activity_type in VALID_ACTIVITY_TYPES
 
     def is_valid_entity_type(self) -> bool:
         """Validate that the entity type is valid."""
         if self.entity_type is None:
             return True  # Entity type is optional
 
-        valid_entity_types = {"profile", "address", "preferences"}
-        return self.entity_type in valid_entity_types
+        return self.entity_type in VALID_ENTITY_TYPES
 
     def get_activity_summary(self) -> str:
         """Get a concise summary of the activity."""
@@ -156,18 +193,13 @@ class ActivityLog(Base):
 
     def sanitize_sensitive_data(self) -> None:
         """Remove sensitive data from old_values and new_values."""
-        sensitive_fields = {
-            "password", "password_hash", "api_key", "secret", "token",
-            "ssn", "credit_card", "bank_account", "private_key"
-        }
-
         def sanitize_dict(data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
             if not data:
                 return data
 
             sanitized = {}
             for key, value in data.items():
-                if any(sensitive in key.lower() for sensitive in sensitive_fields):
+                if _SENSITIVE_RE.search(key.lower()):
                     sanitized[key] = "[REDACTED]"
                 else:
                     sanitized[key] = value
@@ -178,14 +210,53 @@ class ActivityLog(Base):
 
     def to_dict(self) -> dict:
         """Convert the activity log to a dictionary representation."""
-        return {
-            "id": self.id,
-            "user_id": self.user_id,
-            "activity_type": self.activity_type,
-            "description": self.description,
-            "entity_type": self.entity_type,
-            "entity_id": self.entity_id,
-            "created_at": self.created_at.isoformat(),
-            # Note: Sensitive fields like IP, user agent, and change details
-            # are not included in the public dict representation
-        }
\ No newline at end of file
+        # Note: Sensitive fields like IP, user agent, and change details
+        # are not included in the public dict representation
+        return _public_row_to_dict(_PUBLIC_GETTER(self))
+
+    @classmethod
+    def public_columns(cls) -> tuple:
+        """Columns of the public dict representation, in ``to_dict`` order.
+
+        Pass these to ``Query.with_entities`` to fetch plain rows that
+        ``to_dict_batch`` can serialize without building ORM objects.
+        """
+        return tuple(getattr(cls, name) for name in _PUBLIC_FIELDS)
+
+    @classmethod
+    def iter_rows(
+        cls, session: "Session", user_id: int, limit: Optional[int] = None
+    ) -> Iterator[Sequence[Any]]:
+        """Stream a user's activities, newest first, as ``public_columns()`` rows.
+
+        Rows are fetched in batches via ``yield_per`` and never hydrated into
+        ORM objects, which keeps memory flat for exports and large listings.
+        Feed the result to ``to_dict_batch`` or serialize rows incrementally.
+        """
+        query = (
+            session.query(*cls.public_columns())
+            .filter(cls.user_id == user_id)
+            .order_by(cls.created_at.desc())
+        )
+        if limit:
+            query = query.limit(limit)
+        return iter(query.yield_per(1000))
+
+    @classmethod
+    def to_dict_batch(cls, rows: Iterable[Sequence[Any]]) -> List[dict]:
+        """Convert rows selected with ``public_columns()`` to dictionaries."""
+        return [_public_row_to_dict(row) for row in rows]
+
+
+def _public_row_to_dict(row: Sequence[Any]) -> dict:
+    """Build the public dict from a row of ``_PUBLIC_FIELDS`` values."""
+    id_, user_id, activity_type, description, entity_type, entity_id, created_at = row
+    return {
+        "id": id_,
+        "user_id": user_id,
+        "activity_type": activity_type,
+        "description": description,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "created_at": created_at.isoformat() if created_at else None,
+    }
@@ -5,19 +5,73 @@ supporting both shipping and billing addresses with default management.
 """
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Literal, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Literal, Mapping, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
+from ..schemas.address import ADDRESS_TYPES
 from .base import Base
 
 if TYPE_CHECKING:
     from .user_profile import UserProfile
 
+# Basic country code mapping - could be expanded
+_COUNTRY_NAMES: Mapping[str, str] = MappingProxyType({
+    "US": "United States",
+    "CA": "Canada",
+    "GB": "United Kingdom",
+    "FR": "France",
+    "DE": "Germany",
+    "JP": "Japan",
+    "AU": "Australia",
+})
+
+# Basic ISO 3166-1 alpha-2 validation - could be expanded with full ISO list
+_VALID_COUNTRIES = frozenset({
+    "US", "CA", "GB", "FR", "DE", "JP", "AU", "IT", "ES", "NL",
+    "SE", "NO", "DK", "FI", "BE", "CH", "AT", "IE", "PT", "GR",
+    "CZ", "PL", "HU", "SK", "SI", "HR", "EE", "LV", "LT", "MT",
+    "CY", "LU", "BG", "RO", "MX", "BR", "AR", "CL", "CO", "PE",
+    "CN", "IN", "KR", "TH", "SG", "MY", "ID", "PH", "VN", "TW",
+    "HK", "MO", "NZ", "ZA", "EG", "IL", "TR", "RU", "UA", "BY"
+})
+
 AddressType = Literal["shipping", "billing"]
 
 
+def format_address(
+    street_address: str,
+    address_line_2: Optional[str],
+    city: str,
+    state_province: Optional[str],
+    postal_code: str,
+    country: str,
+) -> str:
+    """Format address parts as display lines.
+
+    Works on plain values, so bulk exports can format Core rows without
+    building Address instances.
+    """
+    # City, State/Province Postal Code
+    if state_province:
+        city_line = f"{city}, {state_province} {postal_code}"
+    else:
+        city_line = f"{city} {postal_code}"
+
+    if address_line_2:
+        lines = [street_address, address_line_2, city_line]
+    else:
+        lines = [street_address, city_line]
+
+    # Country (if not US, show country name)
+    if country != "US":
+        lines.append(_COUNTRY_NAMES.get(country, country))
+
+    return "\n".join(lines)
+
+
 class Address(Base):
     """Address model for shipping and billing addresses.
 
@@ -41,6 +95,20 @@ class Address(Base):
     """
 
     __tablename__ = "addresses"
+    __table_args__ = (
+        # Per-user listing and default lookups filter on all three columns;
+        # also serves plain user_id lookups through its leading column
+        Index("ix_addresses_user_type_default", "user_id", "address_type", "is_default"),
+        # At most one default address per user and address type
+        Index(
+            "uq_addresses_user_type_default",
+            "user_id",
+            "address_type",
+            unique=True,
+            postgresql_where=text("is_default"),
+            sqlite_where=text("is_default"),
+        ),
+    )
 
     # Primary key
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
@@ -49,12 +117,11 @@ class Address(Base):
     user_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("user_profiles.user_id", ondelete="CASCADE"),
-        nullable=False,
-        index=True
+        nullable=False
     )
 
     # Address information
-    address_type: Mapped[str] = mapped_column(String(20), nullable=False, index=True)
+    address_type: Mapped[str] = mapped_column(String(20), nullable=False)
     street_address: Mapped[str] = mapped_column(Text, nullable=False)
     address_line_2: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     city: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -64,7 +131,7 @@ class Address(Base):
 
     # Address metadata
     label: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
-    is_default: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False, index=True)
+    is_default: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
 
     # Audit fields
     created_at: Mapped[datetime] = mapped_column(
@@ -91,54 +158,26 @@ class Address(Base):
 
     def get_formatted_address(self) -> str:
         """Get a formatted address string for display."""
-        lines = [self.street_address]
-
-        if self.address_line_2:
-            lines.append(self.address_line_2)
-
-        # City, State/Province Postal Code
-        city_line = self.city
-        if self.state_province:
-            city_line += f", {self.state_province}"
-        city_line += f" {self.postal_code}"
-        lines.append(city_line)
-
-        # Country (if not US, show country name)
-        if self.country != "US":
-            lines.append(self.get_country_name())
-
-        return "\n".join(lines)
+        return format_address(
+            self.street_address,
+            self.address_line_2,
+            self.city,
+            self.state_province,
+            self.postal_code,
+            self.country,
+        )
 
     def get_country_name(self) -> str:
         """Get the full country name from the country code."""
-        # Basic country code mapping - could be expanded
-        country_names = {
-            "US": "United States",
-            "CA": "Canada",
-            "GB": "United Kingdom",
-            "FR": "France",
-            "DE": "Germany",
-            "JP": "Japan",
-            "AU": "Australia",
-        }
-        return country_names.get(self.country, self.country)
+        return _COUNTRY_NAMES.get(self.country, self.country)
 
     def is_valid_address_type(self) -> bool:
         """Validate that the address type is valid."""
-        return self.address_type in ["shipping", "billing"]
+        return self.address_type in ADDRESS_TYPES
 
     def is_valid_country_code(self) -> bool:
         """Validate that the country code is a valid ISO 3166-1 alpha-2 code."""
-        # Basic validation - could be expanded with full ISO list
-        valid_countries = {
-            "US", "CA", "GB", "FR", "DE", "JP", "AU", "IT", "ES", "NL",
-            "SE", "NO", "DK", "FI", "BE", "CH", "AT", "IE", "PT", "GR",
-            "CZ", "PL", "HU", "SK", "SI", "HR", "EE", "LV", "LT", "MT",
-            "CY", "LU", "BG", "RO", "MX", "BR", "AR", "CL", "CO", "PE",
-            "CN", "IN", "KR", "TH", "SG", "MY", "ID", "PH", "VN", "TW",
-            "HK", "MO", "NZ", "ZA", "EG", "IL", "TR", "RU", "UA", "BY"
-        }
-        return self.country in valid_countries
+        return self.country in _VALID_COUNTRIES
 
     def to_dict(self) -> dict:
         """Convert the address to a dictionary representation."""
@@ -6,8 +6,10 @@ including notification, language, and privacy settings.
 
 from datetime import datetime
 from typing import TYPE_CHECKING, Literal, Optional
+from zoneinfo import available_timezones
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Integer, String, cast, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .base import Base
@@ -17,6 +19,54 @@ if TYPE_CHECKING:
 
 ProfileVisibility = Literal["public", "private"]
 
+# Basic validation sets - could be expanded with full ISO/IANA lists
+_VALID_LANGUAGES = frozenset({
+    "en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh",
+    "ar", "hi", "th", "vi", "tr", "pl", "nl", "sv", "da", "no",
+    "fi", "cs", "hu", "he", "id", "ms", "tl", "uk", "bg", "hr"
+})
+
+_VALID_LANGUAGE_COUNTRIES = frozenset({
+    "US", "CA", "GB", "FR", "DE", "JP", "AU", "IT", "ES", "NL",
+    "SE", "NO", "DK", "FI", "BE", "CH", "AT", "IE", "PT", "GR",
+    "CZ", "PL", "HU", "SK", "SI", "HR", "EE", "LV", "LT", "MT",
+    "CY", "LU", "BG", "RO", "MX", "BR", "AR", "CL", "CO", "PE",
+    "CN", "IN", "KR", "TH", "SG", "MY", "ID", "PH", "VN", "TW"
+})
+
+_VALID_CURRENCIES = frozenset({
+    "USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY",
+    "SEK", "NOK", "DKK", "PLN", "CZK", "HUF", "RON", "BGN",
+    "HRK", "RUB", "TRY", "ZAR", "BRL", "MXN", "INR", "KRW",
+    "THB", "SGD", "MYR", "IDR", "PHP", "VND", "TWD", "HKD",
+    "NZD", "ILS", "AED", "SAR", "EGP", "QAR", "KWD", "BHD"
+})
+
+_COMMON_TIMEZONES = frozenset({
+    "UTC",
+    "America/New_York", "America/Chicago", "America/Denver", "America/Los_Angeles",
+    "America/Toronto", "America/Vancouver", "America/Mexico_City", "America/Sao_Paulo",
+    "Europe/London", "Europe/Paris", "Europe/Berlin", "Europe/Rome", "Europe/Madrid",
+    "Europe/Amsterdam", "Europe/Stockholm", "Europe/Oslo", "Europe/Helsinki",
+    "Europe/Warsaw", "Europe/Prague", "Europe/Budapest", "Europe/Bucharest",
+    "Asia/Tokyo", "Asia/Seoul", "Asia/Shanghai", "Asia/Hong_Kong", "Asia/Singapore",
+    "Asia/Bangkok", "Asia/Jakarta", "Asia/Manila", "Asia/Kolkata", "Asia/Dubai",
+    "Australia/Sydney", "Australia/Melbourne", "Australia/Perth",
+    "Pacific/Auckland", "Africa/Johannesburg", "Africa/Cairo"
+})
+
+# Every IANA zone known to the system, computed once at import. The common
+# zones are kept as a floor for hosts without any tz database, where
+# available_timezones() comes back empty.
+_VALID_TIMEZONES = _COMMON_TIMEZONES | frozenset(available_timezones())
+
+_PROFILE_VISIBILITIES = frozenset({"public", "private"})
+
+# Bit positions of the email notification flags in notification_bitmask
+EMAIL_MARKETING_BIT = 1 << 0
+EMAIL_ORDER_UPDATES_BIT = 1 << 1
+EMAIL_SECURITY_ALERTS_BIT = 1 << 2
+
 
 class UserPreferences(Base):
     """User preferences model for notification, communication, and account settings.
@@ -88,6 +138,30 @@ class UserPreferences(Base):
         back_populates="preferences"
     )
 
+    @hybrid_property
+    def notification_bitmask(self) -> int:
+        """Email notification flags packed into one integer (see ``*_BIT``).
+
+        In queries this is a single integer expression, so "any email
+        notification enabled" filters as ``notification_bitmask != 0``
+        instead of three OR-ed column tests.
+        """
+        return (
+            (EMAIL_MARKETING_BIT if self.email_marketing else 0)
+            | (EMAIL_ORDER_UPDATES_BIT if self.email_order_updates else 0)
+            | (EMAIL_SECURITY_ALERTS_BIT if self.email_security_alerts else 0)
+        )
+
+    @notification_bitmask.expression
+    def notification_bitmask(cls):
+        # The bits never overlap, so addition is equivalent to OR and works on
+        # every backend
+        return (
+            cast(cls.email_marketing, Integer) * EMAIL_MARKETING_BIT
+            + cast(cls.email_order_updates, Integer) * EMAIL_ORDER_UPDATES_BIT
+            + cast(cls.email_security_alerts, Integer) * EMAIL_SECURITY_ALERTS_BIT
+        )
+
     def __repr__(self) -> str:
         """String representation of the UserPreferences."""
         return f"<UserPreferences(id={self.id}, user_id={self.user_id}, language={self.preferred_language})>"
@@ -95,75 +169,32 @@ class UserPreferences(Base):
     def is_valid_language_code(self) -> bool:
         """Validate that the language code follows ISO 639-1 + ISO 3166-1 format."""
         # Basic validation for language-country format
-        if len(self.preferred_language) != 5:
-            return False
-
-        parts = self.preferred_language.split("-")
-        if len(parts) != 2:
-            return False
-
-        language_code, country_code = parts
-        if len(language_code) != 2 or len(country_code) != 2:
+        language_code, sep, country_code = self.preferred_language.partition("-")
+        if not sep or len(language_code) != 2 or len(country_code) != 2:
             return False
 
-        # Basic validation - could be expanded with full ISO lists
-        valid_languages = {
-            "en", "es", "fr", "de", "it", "pt", "ru", "ja", "ko", "zh",
-            "ar", "hi", "th", "vi", "tr", "pl", "nl", "sv", "da", "no",
-            "fi", "cs", "hu", "he", "id", "ms", "tl", "uk", "bg", "hr"
-        }
-
-        valid_countries = {
-            "US", "CA", "GB", "FR", "DE", "JP", "AU", "IT", "ES", "NL",
-            "SE", "NO", "DK", "FI", "BE", "CH", "AT", "IE", "PT", "GR",
-            "CZ", "PL", "HU", "SK", "SI", "HR", "EE", "LV", "LT", "MT",
-            "CY", "LU", "BG", "RO", "MX", "BR", "AR", "CL", "CO", "PE",
-            "CN", "IN", "KR", "TH", "SG", "MY", "ID", "PH", "VN", "TW"
-        }
-
-        return language_code.lower() in valid_languages and country_code.upper() in valid_countries
+        return language_code.lower() in _VALID_LANGUAGES and country_code.upper() in _VALID_LANGUAGE_COUNTRIES
 
     def is_valid_currency_code(self) -> bool:
         """Validate that the currency code is a valid ISO 4217 code."""
-        # Basic validation for common currencies
-        valid_currencies = {
-            "USD", "EUR", "GBP", "JPY", "CAD", "AUD", "CHF", "CNY",
-            "SEK", "NOK", "DKK", "PLN", "CZK", "HUF", "RON", "BGN",
-            "HRK", "RUB", "TRY", "ZAR", "BRL", "MXN", "INR", "KRW",
-            "THB", "SGD", "MYR", "IDR", "PHP", "VND", "TWD", "HKD",
-            "NZD", "ILS", "AED", "SAR", "EGP", "QAR", "KWD", "BHD"
-        }
-        return self.preferred_currency in valid_currencies
+        return self.preferred_currency in _VALID_CURRENCIES
 
     def is_valid_timezone(self) -> bool:
         """Validate that the timezone is a valid IANA timezone identifier."""
-        # Basic validation - could be expanded with full IANA list
-        valid_timezones = {
-            "UTC",
-            "America/New_York", "America/Chicago", "America/Denver", "America/Los_Angeles",
-            "America/Toronto", "America/Vancouver", "America/Mexico_City", "America/Sao_Paulo",
-            "Europe/London", "Europe/Paris", "Europe/Berlin", "Europe/Rome", "Europe/Madrid",
-            "Europe/Amsterdam", "Europe/Stockholm", "Europe/Oslo", "Europe/Helsinki",
-            "Europe/Warsaw", "Europe/Prague", "Europe/Budapest", "Europe/Bucharest",
-            "Asia/Tokyo", "Asia/Seoul", "Asia/Shanghai", "Asia/Hong_Kong", "Asia/Singapore",
-            "Asia/Bangkok", "Asia/Jakarta", "Asia/Manila", "Asia/Kolkata", "Asia/Dubai",
-            "Australia/Sydney", "Australia/Melbourne", "Australia/Perth",
-            "Pacific/Auckland", "Africa/Johannesburg", "Africa/Cairo"
-        }
-        return self.timezone in valid_timezones
+        return self.timezone in _VALID_TIMEZONES
 
     def is_valid_profile_visibility(self) -> bool:
         """Validate that the profile visibility is a valid option."""
-        return self.profile_visibility in ["public", "private"]
+        return self.profile_visibility in _PROFILE_VISIBILITIES
 
     def get_notification_summary(self) -> dict:
         """Get a summary of notification preferences."""
         return {
-            "email_enabled": any([
-                self.email_marketing,
-                self.email_order_updates,
-                self.email_security_alerts
-            ]),
+            "email_enabled": bool(
+                self.email_marketing
+                or self.email_order_updates
+                or self.email_security_alerts
+            ),
             "sms_enabled": self.sms_notifications,
             "marketing_enabled": self.email_marketing,
             "order_updates_enabled": self.email_order_updates,
@@ -81,11 +81,15 @@ class UserProfile(Base):
         cascade="all, delete-orphan"
     )
 
+    # The activity history is unbounded, so it stays lazy and is read through
+    # paginated ActivityLog queries. The ON DELETE CASCADE foreign key removes
+    # it with the profile, without loading every row first.
     activity_logs: Mapped[List["ActivityLog"]] = relationship(
         "ActivityLog",
         back_populates="user_profile",
         cascade="all, delete-orphan",
-        order_by="ActivityLog.created_at.desc()"
+        order_by="ActivityLog.created_at.desc()",
+        passive_deletes=True
     )
 
     def __repr__(self) -> str:
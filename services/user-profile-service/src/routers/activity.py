@@ -1,21 +1,52 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.orm import Session
 from typing import Optional
 
+import orjson
+
 from ..database import get_db
 from ..schemas.activity import ActivityListResponse, ActivityResponse
+from ..schemas.orm import from_orm_trusted, model_json_response
 from ..services.activity_service import ActivityService
-from ..dependencies import get_current_user
+from ..dependencies import CurrentUser
 
 router = APIRouter(prefix="/activity", tags=["Activity"])
 
+# The activity type catalogue is fixed, so encode it once at import
+_ACTIVITY_TYPES_JSON = orjson.dumps({
+    "profile_activities": [
+        "profile_created",
+        "profile_updated",
+        "profile_viewed",
+        "profile_deleted"
+    ],
+    "address_activities": [
+        "address_created",
+        "address_updated",
+        "address_deleted",
+        "address_default_changed"
+    ],
+    "preference_activities": [
+        "preferences_created",
+        "preferences_updated",
+        "preferences_reset",
+        "notification_settings_changed",
+        "privacy_settings_changed"
+    ],
+    "authentication_activities": [
+        "profile_access_denied",
+        "admin_access"
+    ]
+})
+_ACTIVITY_TYPES_HEADERS = {"Cache-Control": "public, max-age=86400"}
+
 
 @router.get("", response_model=ActivityListResponse)
-async def get_activity_history(
+def get_activity_history(
     limit: int = Query(20, ge=1, le=100, description="Number of activities to return"),
     offset: int = Query(0, ge=0, description="Number of activities to skip"),
     activity_type: Optional[str] = Query(None, description="Filter by activity type"),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = CurrentUser,
     db: Session = Depends(get_db)
 ):
     """Get user activity history."""
@@ -27,18 +58,19 @@ async def get_activity_history(
         offset=offset
     )
 
-    return ActivityListResponse(
-        activities=[ActivityResponse.from_orm(activity) for activity in activities],
+    return model_json_response(ActivityListResponse(
+        activities=[from_orm_trusted(ActivityResponse, activity) for activity in activities],
         total=total,
         limit=limit,
-        offset=offset
-    )
+        offset=offset,
+        has_more=offset + len(activities) < total
+    ))
 
 
 @router.get("/summary")
-async def get_activity_summary(
+def get_activity_summary(
     days: int = Query(30, ge=1, le=365, description="Number of days to include in summary"),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = CurrentUser,
     db: Session = Depends(get_db)
 ):
     """Get activity summary for the last N days."""
@@ -58,28 +90,8 @@ async def get_activity_summary(
 @router.get("/types")
 async def get_activity_types():
     """Get available activity types."""
-    return {
-        "profile_activities": [
-            "profile_created",
-            "profile_updated",
-            "profile_viewed",
-            "profile_deleted"
-        ],
-        "address_activities": [
-            "address_created",
-            "address_updated",
-            "address_deleted",
-            "address_default_changed"
-        ],
-        "preference_activities": [
-            "preferences_created",
-            "preferences_updated",
-            "preferences_reset",
-            "notification_settings_changed",
-            "privacy_settings_changed"
-        ],
-        "authentication_activities": [
-            "profile_access_denied",
-            "admin_access"
-        ]
-    }
\ No newline at end of file
+    return Response(
+        content=_ACTIVITY_TYPES_JSON,
+        media_type="application/json",
+        headers=_ACTIVITY_TYPES_HEADERS
+    )
@@ -3,40 +3,43 @@ from sqlalchemy.orm import Session
 from typing import Optional, List
 
 from ..database import get_db
-from ..schemas.address import AddressCreateRequest, AddressUpdateRequest, AddressResponse
+from ..schemas.address import ADDRESS_TYPES, AddressCreateRequest, AddressUpdateRequest, AddressResponse
+from ..schemas.orm import from_orm_trusted, orm_list_json_response
 from ..services.address_service import AddressService
-from ..dependencies import get_current_user, get_request_context
+from ..dependencies import CurrentUser, RequestContext
 
 router = APIRouter(prefix="/addresses", tags=["Addresses"])
 
 
 @router.get("", response_model=List[AddressResponse])
-async def get_addresses(
+def get_addresses(
     type: Optional[str] = Query(None, description="Filter by address type (shipping or billing)"),
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = CurrentUser,
     db: Session = Depends(get_db)
 ):
     """Get user's addresses."""
-    if type and type not in ["shipping", "billing"]:
+    if type and type not in ADDRESS_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Address type must be 'shipping' or 'billing'"
         )
 
     address_service = AddressService(db)
-    addresses = address_service.get_user_addresses(
+    rows = address_service.list_user_addresses_core(
         user_id=current_user["user_id"],
         address_type=type
     )
 
-    return [AddressResponse.from_orm(address) for address in addresses]
+    # Rows come straight from the addresses table, so serialize them without
+    # ORM hydration (see from_orm_trusted)
+    return orm_list_json_response(AddressResponse, rows)
 
 
 @router.post("", response_model=AddressResponse, status_code=status.HTTP_201_CREATED)
-async def create_address(
+def create_address(
     address_data: AddressCreateRequest,
-    current_user: dict = Depends(get_current_user),
-    request_context: dict = Depends(get_request_context),
+    current_user: dict = CurrentUser,
+    request_context: dict = RequestContext,
     db: Session = Depends(get_db)
 ):
     """Add new address."""
@@ -50,7 +53,7 @@ async def create_address(
             user_agent=request_context.get("user_agent"),
             correlation_id=request_context.get("correlation_id")
         )
-        return AddressResponse.from_orm(address)
+        return from_orm_trusted(AddressResponse, address)
 
     except ValueError as e:
         raise HTTPException(
@@ -60,9 +63,9 @@ async def create_address(
 
 
 @router.get("/{address_id}", response_model=AddressResponse)
-async def get_address(
+def get_address(
     address_id: int,
-    current_user: dict = Depends(get_current_user),
+    current_user: dict = CurrentUser,
     db: Session = Depends(get_db)
 ):
     """Get specific address."""
@@ -78,15 +81,15 @@ async def get_address(
             detail="Address not found"
         )
 
-    return AddressResponse.from_orm(address)
+    return from_orm_trusted(AddressResponse, address)
 
 
 @router.put("/{address_id}", response_model=AddressResponse)
-async def update_address(
+def update_address(
     address_id: int,
     address_data: AddressUpdateRequest,
-    current_user: dict = Depends(get_current_user),
-    request_context: dict = Depends(get_request_context),
+    current_user: dict = CurrentUser,
+    request_context: dict = RequestContext,
     db: Session = Depends(get_db)
 ):
     """Update address."""
@@ -108,7 +111,7 @@ async def update_address(
                 detail="Address not found"
             )
 
-        return AddressResponse.from_orm(address)
+        return from_orm_trusted(AddressResponse, address)
 
     except ValueError as e:
         raise HTTPException(
@@ -118,10 +121,10 @@ async def update_address(
 
 
 @router.delete("/{address_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_address(
+def delete_address(
     address_id: int,
-    current_user: dict = Depends(get_current_user),
-    request_context: dict = Depends(get_request_context),
+    current_user: dict = CurrentUser,
+    request_context: dict = RequestContext,
     db: Session = Depends(get_db)
 ):
     """Delete address."""
@@ -156,10 +159,10 @@ async def delete_address(
 
 
 @router.put("/{address_id}/default", response_model=AddressResponse)
-async def set_default_address(
+def set_default_address(
     address_id: int,
-    current_user: dict = Depends(get_current_user),
-    request_context: dict = Depends(get_request_context),
+    current_user: dict = CurrentUser,
+    request_context: dict = RequestContext,
     db: Session = Depends(get_db)
 ):
     """Set address as default."""
@@ -180,7 +183,7 @@ async def set_default_address(
                 detail="Address not found"
             )
 
-        return AddressResponse.from_orm(address)
+        return from_orm_trusted(AddressResponse, address)
 
     except ValueError as e:
         raise HTTPException(
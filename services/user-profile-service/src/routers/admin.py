@@ -1,172 +1,179 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
+from datetime import datetime
 from typing import Optional, List
 
-from ..database import get_db
+from ..config import get_settings
+from ..schemas.orm import (
+    from_orm_trusted,
+    model_json_response,
+    orm_json_response,
+    orm_list_json_response
+)
 from ..schemas.profile import ProfileResponse
 from ..schemas.activity import ActivityListResponse, ActivityResponse
 from ..schemas.preferences import PreferencesResponse
-from ..schemas.address import AddressResponse
+from ..schemas.address import ADDRESS_TYPES, AddressResponse
 from ..services.profile_service import ProfileService
 from ..services.address_service import AddressService
 from ..services.preferences_service import PreferencesService
 from ..services.activity_service import ActivityService
-from ..dependencies import get_current_user, get_request_context, require_admin
+from ..services.activity_writer import activity_writer
+from ..dependencies import (
+    AdminAccessLog,
+    AdminAccessLogger,
+    AdminUser,
+    RequestContext,
+    get_activity_service,
+    get_address_service,
+    get_preferences_service,
+    get_profile_service
+)
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
 @router.get("/profiles/{user_id}", response_model=ProfileResponse)
-async def get_user_profile_admin(
+def get_user_profile_admin(
     user_id: int,
-    current_user: dict = Depends(require_admin),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = AdminUser,
+    profile_service: ProfileService = Depends(get_profile_service),
+    log_admin_access: AdminAccessLogger = AdminAccessLog
 ):
     """Get user profile (admin only)."""
-    profile_service = ProfileService(db)
     profile = profile_service.get_profile_by_user_id(user_id)
 
     if not profile:
+        activity_writer.record_miss(current_user["email"], "profile")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found"
         )
 
     # Log admin access
-    activity_service = ActivityService(db)
-    activity_service.log_activity(
-        user_id=user_id,
-        activity_type="admin_access",
-        description=f"Admin user {current_user['email']} accessed profile",
-        entity_type="profile",
-        entity_id=profile.id,
-        ip_address=request_context.get("ip_address"),
-        user_agent=request_context.get("user_agent"),
-        correlation_id=request_context.get("correlation_id")
-    )
-    db.commit()
+    log_admin_access(user_id, "profile", "Admin user {email} accessed profile", entity_id=profile.id)
 
-    return ProfileResponse.from_orm(profile)
+    return orm_json_response(ProfileResponse, profile)
 
 
 @router.get("/profiles/{user_id}/addresses", response_model=List[AddressResponse])
-async def get_user_addresses_admin(
+def get_user_addresses_admin(
     user_id: int,
     type: Optional[str] = Query(None, description="Filter by address type"),
-    current_user: dict = Depends(require_admin),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = AdminUser,
+    address_service: AddressService = Depends(get_address_service),
+    log_admin_access: AdminAccessLogger = AdminAccessLog
 ):
     """Get user addresses (admin only)."""
-    if type and type not in ["shipping", "billing"]:
+    if type and type not in ADDRESS_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Address type must be 'shipping' or 'billing'"
         )
 
-    address_service = AddressService(db)
-    addresses = address_service.get_user_addresses(user_id=user_id, address_type=type)
-
     # Log admin access
-    activity_service = ActivityService(db)
-    activity_service.log_activity(
-        user_id=user_id,
-        activity_type="admin_access",
-        description=f"Admin user {current_user['email']} accessed addresses",
-        entity_type="address",
-        ip_address=request_context.get("ip_address"),
-        user_agent=request_context.get("user_agent"),
-        correlation_id=request_context.get("correlation_id")
-    )
-    db.commit()
+    log_admin_access(user_id, "address", "Admin user {email} accessed addresses")
+
+    if get_settings().sql_json_responses:
+        return Response(
+            content=address_service.get_user_addresses_json(user_id=user_id, address_type=type),
+            media_type="application/json"
+        )
 
-    return [AddressResponse.from_orm(address) for address in addresses]
+    addresses = address_service.get_user_addresses(user_id=user_id, address_type=type)
+    return orm_list_json_response(AddressResponse, addresses)
 
 
 @router.get("/profiles/{user_id}/preferences", response_model=PreferencesResponse)
-async def get_user_preferences_admin(
+def get_user_preferences_admin(
     user_id: int,
-    current_user: dict = Depends(require_admin),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = AdminUser,
+    preferences_service: PreferencesService = Depends(get_preferences_service),
+    log_admin_access: AdminAccessLogger = AdminAccessLog
 ):
     """Get user preferences (admin only)."""
-    preferences_service = PreferencesService(db)
     preferences = preferences_service.get_user_preferences(user_id)
 
     if not preferences:
+        activity_writer.record_miss(current_user["email"], "preferences")
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Preferences not found"
         )
 
     # Log admin access
-    activity_service = ActivityService(db)
-    activity_service.log_activity(
-        user_id=user_id,
-        activity_type="admin_access",
-        description=f"Admin user {current_user['email']} accessed preferences",
-        entity_type="preferences",
-        entity_id=preferences.id,
-        ip_address=request_context.get("ip_address"),
-        user_agent=request_context.get("user_agent"),
-        correlation_id=request_context.get("correlation_id")
+    log_admin_access(
+        user_id, "preferences", "Admin user {email} accessed preferences", entity_id=preferences.id
     )
-    db.commit()
 
-    return PreferencesResponse.from_orm(preferences)
+    return orm_json_response(PreferencesResponse, preferences)
 
 
 @router.get("/profiles/{user_id}/activity", response_model=ActivityListResponse)
-async def get_user_activity_admin(
+def get_user_activity_admin(
     user_id: int,
     limit: int = Query(20, ge=1, le=100, description="Number of activities to return"),
-    offset: int = Query(0, ge=0, description="Number of activities to skip"),
+    offset: int = Query(0, ge=0, description="Number of activities to skip (prefer 'before')"),
+    before: Optional[datetime] = Query(None, description="Cursor: next_cursor from the previous page"),
+    before_id: Optional[int] = Query(None, description="Cursor: next_cursor_id from the previous page (required with before)"),
     activity_type: Optional[str] = Query(None, description="Filter by activity type"),
-    current_user: dict = Depends(require_admin),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = AdminUser,
+    activity_service: ActivityService = Depends(get_activity_service),
+    log_admin_access: AdminAccessLogger = AdminAccessLog
 ):
-    """Get user activity history (admin only)."""
-    activity_service = ActivityService(db)
-    activities, total = activity_service.get_user_activities(
-        user_id=user_id,
-        activity_type=activity_type,
-        limit=limit,
-        offset=offset
-    )
+    """Get user activity history (admin only).
+
+    Page with the before/before_id cursor returned as next_cursor and
+    next_cursor_id (both are required together): cursor pages skip the COUNT and report total as null.
+    offset (with total) is kept for existing clients.
+    """
+    if before is not None:
+        if before_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="before_id is required with before"
+            )
+        activities, has_more = activity_service.get_user_activities_page(
+            user_id=user_id,
+            activity_type=activity_type,
+            limit=limit,
+            before=before,
+            before_id=before_id
+        )
+        total = None
+    else:
+        activities, total = activity_service.get_user_activities(
+            user_id=user_id,
+            activity_type=activity_type,
+            limit=limit,
+            offset=offset
+        )
+        has_more = offset + len(activities) < total
 
     # Log admin access
-    activity_service.log_activity(
-        user_id=user_id,
-        activity_type="admin_access",
-        description=f"Admin user {current_user['email']} accessed activity log",
-        entity_type="activity",
-        ip_address=request_context.get("ip_address"),
-        user_agent=request_context.get("user_agent"),
-        correlation_id=request_context.get("correlation_id")
-    )
-    db.commit()
+    log_admin_access(user_id, "activity", "Admin user {email} accessed activity log")
+
+    last = activities[-1] if has_more else None
 
-    return ActivityListResponse(
-        activities=[ActivityResponse.from_orm(activity) for activity in activities],
+    return model_json_response(ActivityListResponse(
+        activities=[from_orm_trusted(ActivityResponse, activity) for activity in activities],
         total=total,
         limit=limit,
-        offset=offset
-    )
+        offset=offset,
+        has_more=has_more,
+        next_cursor=last.created_at if last else None,
+        next_cursor_id=last.id if last else None
+    ))
 
 
 @router.delete("/profiles/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user_profile_admin(
+def delete_user_profile_admin(
     user_id: int,
-    current_user: dict = Depends(require_admin),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = AdminUser,
+    request_context: dict = RequestContext,
+    profile_service: ProfileService = Depends(get_profile_service),
+    log_admin_access: AdminAccessLogger = AdminAccessLog
 ):
     """Delete user profile (admin only)."""
-    profile_service = ProfileService(db)
-
     try:
         deleted = profile_service.delete_profile(
             user_id=user_id,
@@ -182,17 +189,10 @@ async def delete_user_profile_admin(
             )
 
         # Log admin action
-        activity_service = ActivityService(db)
-        activity_service.log_activity(
-            user_id=user_id,
-            activity_type="admin_profile_deleted",
-            description=f"Profile deleted by admin user {current_user['email']}",
-            entity_type="profile",
-            ip_address=request_context.get("ip_address"),
-            user_agent=request_context.get("user_agent"),
-            correlation_id=request_context.get("correlation_id")
+        log_admin_access(
+            user_id, "profile", "Profile deleted by admin user {email}",
+            activity_type="admin_profile_deleted"
         )
-        db.commit()
 
     except ValueError as e:
         raise HTTPException(
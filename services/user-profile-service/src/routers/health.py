@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import text
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+import asyncio
+import time
 
 from ..database import get_db
 from ..schemas.health import HealthResponse, ReadinessResponse, ReadinessChecks, HealthStatus, ReadinessStatus, DatabaseStatus
@@ -10,13 +12,30 @@ from ..config import get_auth_service
 
 router = APIRouter(tags=["Health"])
 
+# A READY result is reused for this long (seconds), so bursts of probes
+# from several probers collapse into one real check
+READINESS_CACHE_TTL = 1.0
+
+_last_readiness: Optional[Tuple[float, ReadinessResponse]] = None
+_readiness_lock = asyncio.Lock()
+
+
+# Sent to the driver as is, skipping SQLAlchemy statement compilation
+_PING_SQL = "SELECT 1"
+
+
+def _ping_database(db: Session) -> bool:
+    """Run a trivial query; raises if the database is unreachable."""
+    db.connection().exec_driver_sql(_PING_SQL)
+    return True
+
 
 @router.get("/health", response_model=HealthResponse)
 async def health_check(db: Session = Depends(get_db)):
     """Basic health check endpoint."""
     try:
         # Test database connection
-        db.execute(text("SELECT 1"))
+        _ping_database(db)
         database_status = DatabaseStatus.CONNECTED
         overall_status = HealthStatus.HEALTHY
     except Exception:
@@ -27,36 +46,70 @@ async def health_check(db: Session = Depends(get_db)):
         status=overall_status,
         service="user-profile-service",
         version="1.0.0",
-        timestamp=datetime.utcnow(),
+        timestamp=datetime.now(timezone.utc),
         database=database_status
     )
 
 
+def _cached_readiness() -> Optional[ReadinessResponse]:
+    """Return the last readiness response if it was READY and is still fresh.
+
+    The checks are reused as is; only the timestamp is refreshed.
+    """
+    cached = _last_readiness
+    if cached is None:
+        return None
+    checked_at, response = cached
+    if time.monotonic() - checked_at >= READINESS_CACHE_TTL:
+        return None
+    if response.status != ReadinessStatus.READY:
+        return None
+    return response.model_copy(update={"timestamp": datetime.now(timezone.utc)})
+
+
 @router.get("/health/ready", response_model=ReadinessResponse)
 async def readiness_check(
     db: Session = Depends(get_db),
     auth_service: AuthService = Depends(get_auth_service)
 ):
     """Readiness check with dependency verification."""
+    global _last_readiness
+
+    cached = _cached_readiness()
+    if cached is not None:
+        return cached
+
+    async with _readiness_lock:
+        # Another probe may have refreshed the result while this one waited
+        cached = _cached_readiness()
+        if cached is not None:
+            return cached
+
+        response = await _check_readiness(db, auth_service)
+        # NOT_READY is never served from the cache, so failures surface on
+        # the very next probe
+        _last_readiness = (time.monotonic(), response)
+        return response
+
+
+async def _check_readiness(db: Session, auth_service: AuthService) -> ReadinessResponse:
+    """Run the database and auth service checks."""
     checks = ReadinessChecks(
         database=ReadinessStatus.NOT_READY,
         auth_service=ReadinessStatus.NOT_READY
     )
 
-    # Check database
-    try:
-        db.execute(text("SELECT 1"))
+    # Check database and auth service concurrently; the blocking DB ping
+    # runs in a worker thread while the auth service request is in flight
+    db_ok, auth_ok = await asyncio.gather(
+        asyncio.to_thread(_ping_database, db),
+        auth_service.check_auth_service_health(),
+        return_exceptions=True
+    )
+    if db_ok is True:
         checks.database = ReadinessStatus.READY
-    except Exception:
-        pass
-
-    # Check auth service
-    try:
-        auth_healthy = await auth_service.check_auth_service_health()
-        if auth_healthy:
-            checks.auth_service = ReadinessStatus.READY
-    except Exception:
-        pass
+    if auth_ok and not isinstance(auth_ok, BaseException):
+        checks.auth_service = ReadinessStatus.READY
 
     # Overall readiness
     overall_status = ReadinessStatus.READY if (
@@ -68,5 +121,5 @@ async def readiness_check(
         status=overall_status,
         service="user-profile-service",
         checks=checks,
-        timestamp=datetime.utcnow()
+        timestamp=datetime.now(timezone.utc)
     )
\ No newline at end of file
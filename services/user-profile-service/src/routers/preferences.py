@@ -1,35 +1,32 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
 
-from ..database import get_db
+from ..schemas.orm import orm_json_response
 from ..schemas.preferences import PreferencesUpdateRequest, PreferencesResponse
 from ..services.preferences_service import PreferencesService
-from ..dependencies import get_current_user, get_request_context
+from ..dependencies import CurrentUser, RequestContext, get_preferences_service
 
 router = APIRouter(prefix="/preferences", tags=["Preferences"])
 
 
 @router.get("", response_model=PreferencesResponse)
 async def get_preferences(
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: dict = CurrentUser,
+    preferences_service: PreferencesService = Depends(get_preferences_service)
 ):
     """Get user preferences."""
-    preferences_service = PreferencesService(db)
     preferences = preferences_service.get_or_create_preferences(current_user["user_id"])
 
-    return PreferencesResponse.from_orm(preferences)
+    return orm_json_response(PreferencesResponse, preferences)
 
 
 @router.put("", response_model=PreferencesResponse)
 async def update_preferences(
     preferences_data: PreferencesUpdateRequest,
-    current_user: dict = Depends(get_current_user),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = CurrentUser,
+    request_context: dict = RequestContext,
+    preferences_service: PreferencesService = Depends(get_preferences_service)
 ):
     """Update user preferences."""
-    preferences_service = PreferencesService(db)
 
     try:
         preferences = preferences_service.update_preferences(
@@ -51,12 +48,11 @@ async def update_preferences(
 
 @router.post("/reset", response_model=PreferencesResponse)
 async def reset_preferences(
-    current_user: dict = Depends(get_current_user),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = CurrentUser,
+    request_context: dict = RequestContext,
+    preferences_service: PreferencesService = Depends(get_preferences_service)
 ):
     """Reset user preferences to default values."""
-    preferences_service = PreferencesService(db)
 
     try:
         preferences = preferences_service.reset_preferences_to_default(
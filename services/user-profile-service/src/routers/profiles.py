@@ -1,43 +1,38 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
 from typing import Optional
 
-from ..database import get_db
 from ..schemas.profile import ProfileCreateRequest, ProfileUpdateRequest, ProfileResponse
+from ..schemas.orm import orm_json_response
 from ..schemas.error import ErrorResponse, NotFoundErrorResponse, ConflictErrorResponse
 from ..services.profile_service import ProfileService
-from ..dependencies import get_current_user, get_request_context
+from ..dependencies import CurrentProfile, CurrentUser, RequestContext, get_profile_service
+from ..models.user_profile import UserProfile
 
 router = APIRouter(prefix="/profiles", tags=["Profiles"])
 
 
 @router.get("", response_model=ProfileResponse)
 async def get_profile(
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    profile: Optional[UserProfile] = CurrentProfile
 ):
     """Get current user's profile."""
-    profile_service = ProfileService(db)
-    profile = profile_service.get_profile_by_user_id(current_user["user_id"])
-
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found"
         )
 
-    return ProfileResponse.from_orm(profile)
+    return orm_json_response(ProfileResponse, profile)
 
 
 @router.post("", response_model=ProfileResponse, status_code=status.HTTP_201_CREATED)
 async def create_profile(
     profile_data: ProfileCreateRequest,
-    current_user: dict = Depends(get_current_user),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = CurrentUser,
+    request_context: dict = RequestContext,
+    profile_service: ProfileService = Depends(get_profile_service)
 ):
     """Create user profile."""
-    profile_service = ProfileService(db)
 
     try:
         profile = profile_service.create_profile(
@@ -65,12 +60,11 @@ async def create_profile(
 @router.put("", response_model=ProfileResponse)
 async def update_profile(
     profile_data: ProfileUpdateRequest,
-    current_user: dict = Depends(get_current_user),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = CurrentUser,
+    request_context: dict = RequestContext,
+    profile_service: ProfileService = Depends(get_profile_service)
 ):
     """Update user profile."""
-    profile_service = ProfileService(db)
 
     try:
         profile = profile_service.update_profile(
@@ -98,12 +92,11 @@ async def update_profile(
 
 @router.delete("", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_profile(
-    current_user: dict = Depends(get_current_user),
-    request_context: dict = Depends(get_request_context),
-    db: Session = Depends(get_db)
+    current_user: dict = CurrentUser,
+    request_context: dict = RequestContext,
+    profile_service: ProfileService = Depends(get_profile_service)
 ):
     """Delete user profile."""
-    profile_service = ProfileService(db)
 
     try:
         deleted = profile_service.delete_profile(
@@ -128,10 +121,9 @@ async def delete_profile(
 
 @router.get("/completion", response_model=dict)
 async def get_profile_completion(
-    current_user: dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: dict = CurrentUser,
+    profile_service: ProfileService = Depends(get_profile_service)
 ):
     """Get profile completion status."""
-    profile_service = ProfileService(db)
     completion_status = profile_service.get_profile_completion_status(current_user["user_id"])
     return completion_status
\ No newline at end of file
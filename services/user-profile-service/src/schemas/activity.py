@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ActivityResponse(BaseModel):
@@ -12,18 +12,20 @@ class ActivityResponse(BaseModel):
     entity_id: Optional[int] = Field(None, description="ID of entity affected")
     created_at: datetime = Field(..., description="Activity timestamp")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ActivityListResponse(BaseModel):
     activities: List[ActivityResponse] = Field(..., description="List of user activities")
-    total: int = Field(..., description="Total number of activities for the user")
+    total: Optional[int] = Field(..., description="Total number of activities for the user (null on cursor pages)")
     limit: int = Field(..., description="Number of activities returned")
     offset: int = Field(..., description="Number of activities skipped")
+    has_more: Optional[bool] = Field(None, description="Whether another page follows")
+    next_cursor: Optional[datetime] = Field(
+        None, description="Pass as 'before' to fetch the next page; null on the last page"
+    )
+    next_cursor_id: Optional[int] = Field(
+        None, description="Pass as 'before_id' together with next_cursor"
+    )
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,8 +1,46 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 import re
 
+_CITY_RE = re.compile(r"^[a-zA-Z0-9\s\-'\.]+\Z")
+_STATE_RE = re.compile(r'^[a-zA-Z0-9\s\-]+\Z')
+_LABEL_RE = _STATE_RE
+
+# Valid address types, shared by the routers and the Address model
+ADDRESS_TYPES = frozenset({'shipping', 'billing'})
+
+
+def _check_country(v: str) -> str:
+    # ISO 3166-1 alpha-2 country code validation: two ASCII capitals
+    if not (len(v) == 2 and v.isascii() and v.isalpha() and v.isupper()):
+        raise ValueError('Country must be a valid ISO 3166-1 alpha-2 code (e.g., US, CA, GB)')
+    return v
+
+
+def _clean_city(v: str) -> str:
+    # Allow alphanumeric characters, spaces, hyphens, apostrophes
+    v = v.strip()
+    if not _CITY_RE.match(v):
+        raise ValueError('City name contains invalid characters')
+    return v
+
+
+def _clean_state_province(v: str) -> str:
+    # Allow alphanumeric characters, spaces, hyphens
+    v = v.strip()
+    if not _STATE_RE.match(v):
+        raise ValueError('State/province contains invalid characters')
+    return v
+
+
+def _clean_label(v: str) -> str:
+    # Allow alphanumeric characters, spaces, hyphens
+    v = v.strip()
+    if not _LABEL_RE.match(v):
+        raise ValueError('Label contains invalid characters')
+    return v
+
 
 class AddressCreateRequest(BaseModel):
     address_type: str = Field(..., description="Address type: shipping or billing")
@@ -18,45 +56,33 @@ class AddressCreateRequest(BaseModel):
     @field_validator('address_type')
     @classmethod
     def validate_address_type(cls, v: str) -> str:
-        if v not in ['shipping', 'billing']:
+        if v not in ADDRESS_TYPES:
             raise ValueError('Address type must be either "shipping" or "billing"')
         return v
 
     @field_validator('country')
     @classmethod
     def validate_country(cls, v: str) -> str:
-        # ISO 3166-1 alpha-2 country code validation
-        if not re.match(r'^[A-Z]{2}$', v):
-            raise ValueError('Country must be a valid ISO 3166-1 alpha-2 code (e.g., US, CA, GB)')
-        return v
+        return _check_country(v)
 
     @field_validator('city')
     @classmethod
     def validate_city(cls, v: str) -> str:
-        # Allow alphanumeric characters, spaces, hyphens, apostrophes
-        if not re.match(r'^[a-zA-Z0-9\s\-\'\.]+$', v.strip()):
-            raise ValueError('City name contains invalid characters')
-        return v.strip()
+        return _clean_city(v)
 
     @field_validator('state_province')
     @classmethod
     def validate_state_province(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        # Allow alphanumeric characters, spaces, hyphens
-        if not re.match(r'^[a-zA-Z0-9\s\-]+$', v.strip()):
-            raise ValueError('State/province contains invalid characters')
-        return v.strip()
+        return _clean_state_province(v)
 
     @field_validator('label')
     @classmethod
     def validate_label(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        # Allow alphanumeric characters, spaces, hyphens
-        if not re.match(r'^[a-zA-Z0-9\s\-]+$', v.strip()):
-            raise ValueError('Label contains invalid characters')
-        return v.strip()
+        return _clean_label(v)
 
 
 class AddressUpdateRequest(BaseModel):
@@ -73,40 +99,28 @@ class AddressUpdateRequest(BaseModel):
     def validate_country(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        # ISO 3166-1 alpha-2 country code validation
-        if not re.match(r'^[A-Z]{2}$', v):
-            raise ValueError('Country must be a valid ISO 3166-1 alpha-2 code (e.g., US, CA, GB)')
-        return v
+        return _check_country(v)
 
     @field_validator('city')
     @classmethod
     def validate_city(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        # Allow alphanumeric characters, spaces, hyphens, apostrophes
-        if not re.match(r'^[a-zA-Z0-9\s\-\'\.]+$', v.strip()):
-            raise ValueError('City name contains invalid characters')
-        return v.strip()
+        return _clean_city(v)
 
     @field_validator('state_province')
     @classmethod
     def validate_state_province(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        # Allow alphanumeric characters, spaces, hyphens
-        if not re.match(r'^[a-zA-Z0-9\s\-]+$', v.strip()):
-            raise ValueError('State/province contains invalid characters')
-        return v.strip()
+        return _clean_state_province(v)
 
     @field_validator('label')
     @classmethod
     def validate_label(cls, v: Optional[str]) -> Optional[str]:
         if v is None:
             return v
-        # Allow alphanumeric characters, spaces, hyphens
-        if not re.match(r'^[a-zA-Z0-9\s\-]+$', v.strip()):
-            raise ValueError('Label contains invalid characters')
-        return v.strip()
+        return _clean_label(v)
 
 
 class AddressResponse(BaseModel):
@@ -124,8 +138,4 @@ class AddressResponse(BaseModel):
     created_at: datetime = Field(..., description="Address creation timestamp")
     updated_at: datetime = Field(..., description="Address last update timestamp")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Dict, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -26,16 +26,15 @@ class HealthResponse(BaseModel):
     timestamp: datetime = Field(..., description="Health check timestamp")
     database: DatabaseStatus = Field(..., description="Database connection status")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class ReadinessChecks(BaseModel):
     database: ReadinessStatus = Field(..., description="Database readiness status")
     auth_service: ReadinessStatus = Field(..., description="Auth service readiness status")
 
+    model_config = ConfigDict(use_enum_values=True)
+
 
 class ReadinessResponse(BaseModel):
     status: ReadinessStatus = Field(..., description="Overall service readiness status")
@@ -43,7 +42,4 @@ class ReadinessResponse(BaseModel):
     checks: ReadinessChecks = Field(..., description="Individual readiness checks")
     timestamp: datetime = Field(..., description="Readiness check timestamp")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    model_config = ConfigDict(use_enum_values=True)
\ No newline at end of file
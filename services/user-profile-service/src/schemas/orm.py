@@ -0,0 +1,64 @@
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterable, List, Type, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
+
+from ..config import get_settings
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _field_reader(model_cls: Type[BaseModel]) -> Callable[[Any], dict]:
+    """Build a function reading a model's fields off an object in one call."""
+    fields = tuple(model_cls.model_fields)
+    getter = attrgetter(*fields)
+    if len(fields) == 1:
+        return lambda obj: {fields[0]: getter(obj)}
+    return lambda obj: dict(zip(fields, getter(obj), strict=True))
+
+
+def from_orm_trusted(model_cls: Type[ModelT], obj: Any) -> ModelT:
+    """Build a response model from a database row without re-validating it.
+
+    Only for rows read back from our own tables, whose values were validated
+    on the way in. Request payloads must keep going through validation.
+    With ``trust_orm_responses`` disabled this is a plain ``model_validate``.
+    """
+    if not get_settings().trust_orm_responses:
+        return model_cls.model_validate(obj, from_attributes=True)
+    return model_cls.model_construct(**_field_reader(model_cls)(obj))
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model_cls: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model_cls])
+
+
+def model_json_response(instance: BaseModel) -> Response:
+    """Serialize a response model straight to JSON bytes in pydantic-core.
+
+    Returning a ``Response`` bypasses FastAPI's own validation and encoding
+    of the return value, so callers must hand in an instance of the route's
+    ``response_model`` (kept on the route for the OpenAPI schema).
+    """
+    return Response(
+        content=type(instance).__pydantic_serializer__.to_json(instance),
+        media_type="application/json"
+    )
+
+
+def orm_json_response(model_cls: Type[BaseModel], obj: Any) -> Response:
+    """JSON response for a trusted database row (see ``from_orm_trusted``)."""
+    return model_json_response(from_orm_trusted(model_cls, obj))
+
+
+def orm_list_json_response(model_cls: Type[BaseModel], objs: Iterable[Any]) -> Response:
+    """JSON array response for trusted database rows."""
+    items = [from_orm_trusted(model_cls, obj) for obj in objs]
+    return Response(
+        content=_list_adapter(model_cls).dump_json(items),
+        media_type="application/json"
+    )
@@ -1,10 +1,19 @@
 from datetime import date, datetime
 from typing import Optional
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl, field_validator
+import math
 import re
 
+_PHONE_RE = re.compile(r'^\+[1-9]\d{1,14}$')
+_NAME_RE = re.compile(r'^[a-zA-Z0-9\s\-\']+$')
 
-class ProfileCreateRequest(BaseModel):
+# Age limits (13-120 years of 365.25 days) as whole days
+_MIN_AGE_DAYS = math.ceil(13 * 365.25)
+_MAX_AGE_DAYS = math.floor(120 * 365.25)
+
+
+# Create and update requests take the same fields with the same validation
+class _ProfileRequestBase(BaseModel):
     first_name: Optional[str] = Field(None, max_length=100, description="User's first name")
     last_name: Optional[str] = Field(None, max_length=100, description="User's last name")
     phone: Optional[str] = Field(None, max_length=20, description="Phone number in E.164 format")
@@ -17,7 +26,7 @@ class ProfileCreateRequest(BaseModel):
         if v is None:
             return v
         # E.164 format validation
-        if not re.match(r'^\+[1-9]\d{1,14}$', v):
+        if not _PHONE_RE.match(v):
             raise ValueError('Phone number must be in E.164 format')
         return v
 
@@ -27,7 +36,7 @@ class ProfileCreateRequest(BaseModel):
         if v is None:
             return v
         # Allow alphanumeric characters, spaces, hyphens, apostrophes
-        if not re.match(r'^[a-zA-Z0-9\s\-\']+$', v.strip()):
+        if not _NAME_RE.match(v.strip()):
             raise ValueError('Name contains invalid characters')
         return v.strip()
 
@@ -36,56 +45,23 @@ class ProfileCreateRequest(BaseModel):
     def validate_date_of_birth(cls, v: Optional[date]) -> Optional[date]:
         if v is None:
             return v
+        today = date.today()
         # Check if date is not in the future
-        if v > date.today():
+        if v > today:
             raise ValueError('Date of birth cannot be in the future')
         # Check reasonable age limits (13-120 years old)
-        age = (date.today() - v).days / 365.25
-        if age < 13 or age > 120:
+        age_days = (today - v).days
+        if age_days < _MIN_AGE_DAYS or age_days > _MAX_AGE_DAYS:
             raise ValueError('Age must be between 13 and 120 years')
         return v
 
 
-class ProfileUpdateRequest(BaseModel):
-    first_name: Optional[str] = Field(None, max_length=100, description="User's first name")
-    last_name: Optional[str] = Field(None, max_length=100, description="User's last name")
-    phone: Optional[str] = Field(None, max_length=20, description="Phone number in E.164 format")
-    date_of_birth: Optional[date] = Field(None, description="Date of birth")
-    profile_picture_url: Optional[HttpUrl] = Field(None, description="URL to profile picture")
+class ProfileCreateRequest(_ProfileRequestBase):
+    pass
 
-    @field_validator('phone')
-    @classmethod
-    def validate_phone(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        # E.164 format validation
-        if not re.match(r'^\+[1-9]\d{1,14}$', v):
-            raise ValueError('Phone number must be in E.164 format')
-        return v
-
-    @field_validator('first_name', 'last_name')
-    @classmethod
-    def validate_name(cls, v: Optional[str]) -> Optional[str]:
-        if v is None:
-            return v
-        # Allow alphanumeric characters, spaces, hyphens, apostrophes
-        if not re.match(r'^[a-zA-Z0-9\s\-\']+$', v.strip()):
-            raise ValueError('Name contains invalid characters')
-        return v.strip()
 
-    @field_validator('date_of_birth')
-    @classmethod
-    def validate_date_of_birth(cls, v: Optional[date]) -> Optional[date]:
-        if v is None:
-            return v
-        # Check if date is not in the future
-        if v > date.today():
-            raise ValueError('Date of birth cannot be in the future')
-        # Check reasonable age limits (13-120 years old)
-        age = (date.today() - v).days / 365.25
-        if age < 13 or age > 120:
-            raise ValueError('Age must be between 13 and 120 years')
-        return v
+class ProfileUpdateRequest(_ProfileRequestBase):
+    pass
 
 
 class ProfileResponse(BaseModel):
@@ -99,9 +75,4 @@ class ProfileResponse(BaseModel):
     created_at: datetime = Field(..., description="Profile creation timestamp")
     updated_at: datetime = Field(..., description="Profile last update timestamp")
 
-    class Config:
-        from_attributes = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            date: lambda v: v.isoformat()
-        }
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -1,12 +1,35 @@
+import csv
+import io
 from datetime import datetime
-from typing import Optional, List, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from typing import Optional, List, Dict, Any, Iterable
+
+import orjson
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import and_, desc, func, insert, or_, select
 
 from ..models.activity_log import ActivityLog
 
+# Optional log_activity fields, defaulted to None
+_OPTIONAL_FIELDS = dict.fromkeys((
+    "entity_type", "entity_id", "ip_address", "user_agent",
+    "correlation_id", "old_values", "new_values",
+))
+
+# Columns written by bulk_log_copy; id and created_at use their defaults
+_COPY_COLUMNS = (
+    "user_id", "activity_type", "description", "entity_type", "entity_id",
+    "ip_address", "user_agent", "correlation_id", "old_values", "new_values",
+)
+_COPY_JSON_COLUMNS = frozenset({"old_values", "new_values"})
+_COPY_SQL = (
+    f"COPY {ActivityLog.__tablename__} ({', '.join(_COPY_COLUMNS)}) "
+    "FROM STDIN WITH (FORMAT csv)"
+)
+
 
 class ActivityService:
+    __slots__ = ("db",)
+
     def __init__(self, db: Session):
         self.db = db
 
@@ -41,6 +64,71 @@ class ActivityService:
         # Note: Don't commit here - let the calling service handle the transaction
         return activity
 
+    def log_activities(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Log several activities with one multi-row INSERT.
+
+        Each entry takes the same keys as ``log_activity``'s arguments.
+        Rows go straight to the table through Core, skipping ORM object
+        construction and unit-of-work bookkeeping, and no ActivityLog
+        instances are returned.
+        """
+        # An executemany INSERT takes its column list from the first row, so
+        # give every row the full set of optional keys
+        rows = [{**_OPTIONAL_FIELDS, **entry} for entry in entries]
+        if rows:
+            self.db.execute(insert(ActivityLog), rows)
+        # Note: Don't commit here - let the calling service handle the transaction
+        return len(rows)
+
+    def bulk_log_copy(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Ingest many activities with PostgreSQL ``COPY ... FROM STDIN``.
+
+        Meant for bulk imports such as replaying another service's history;
+        request handlers should keep using ``log_activity``. Entries take
+        the ``log_activity`` keys. The copy runs on the session's connection,
+        inside its transaction. Other databases fall back to
+        ``log_activities``.
+        """
+        if self.db.get_bind().dialect.name != "postgresql":
+            return self.log_activities(entries)
+
+        # QUOTE_NOTNULL quotes every value except None, which COPY's CSV
+        # format then reads as NULL (and "" as an empty string)
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, quoting=csv.QUOTE_NOTNULL)
+        count = 0
+        for entry in entries:
+            row = []
+            for column in _COPY_COLUMNS:
+                value = entry.get(column)
+                if value is not None and column in _COPY_JSON_COLUMNS:
+                    value = orjson.dumps(value).decode()
+                row.append(value)
+            writer.writerow(row)
+            count += 1
+
+        if count:
+            buffer.seek(0)
+            dbapi_connection = self.db.connection().connection.dbapi_connection
+            with dbapi_connection.cursor() as cursor:
+                cursor.copy_expert(_COPY_SQL, buffer)
+        # Note: Don't commit here - let the calling service handle the transaction
+        return count
+
+    def _user_activities_query(self, user_id: int, activity_type: Optional[str] = None):
+        # Listings serialize column data only; raise instead of quietly
+        # issuing a SELECT per row if a relationship is ever touched
+        query = self.db.query(ActivityLog).options(raiseload("*")).filter(
+            ActivityLog.user_id == user_id
+        )
+        if activity_type:
+            query = query.filter(ActivityLog.activity_type == activity_type)
+        return query
+
+    def count_user_activities(self, user_id: int, activity_type: Optional[str] = None) -> int:
+        """Count a user's activities (walks every matching index entry)."""
+        return self._user_activities_query(user_id, activity_type).count()
+
     def get_user_activities(
         self,
         user_id: int,
@@ -48,20 +136,74 @@ class ActivityService:
         limit: int = 20,
         offset: int = 0
     ) -> tuple[List[ActivityLog], int]:
-        """Get user activities with pagination."""
-        query = self.db.query(ActivityLog).filter(ActivityLog.user_id == user_id)
-
-        if activity_type:
-            query = query.filter(ActivityLog.activity_type == activity_type)
+        """Get user activities with pagination.
 
-        # Get total count for pagination
-        total = query.count()
+        Costs a COUNT plus an OFFSET scan; prefer ``get_user_activities_page``
+        where the total isn't needed.
+        """
+        total = self.count_user_activities(user_id, activity_type)
 
-        # Apply pagination and ordering
-        activities = query.order_by(desc(ActivityLog.created_at)).offset(offset).limit(limit).all()
+        query = self._user_activities_query(user_id, activity_type).order_by(
+            desc(ActivityLog.created_at), desc(ActivityLog.id)
+        )
+        if offset:
+            query = query.offset(offset)
+        activities = query.limit(limit).all()
 
         return activities, total
 
+    def get_user_activities_page(
+        self,
+        user_id: int,
+        activity_type: Optional[str] = None,
+        limit: int = 20,
+        before: Optional[datetime] = None,
+        before_id: Optional[int] = None
+    ) -> tuple[List[ActivityLog], bool]:
+        """Get a page of user activities by keyset, and whether more follow.
+
+        Pass the previous page's last ``created_at`` as ``before`` and its
+        ``id`` as ``before_id``; ``before`` alone is rejected. The page is
+        one range scan of the (user_id, created_at) index, however deep,
+        with no COUNT.
+        """
+        if before is not None and before_id is None:
+            raise ValueError("before_id is required with before")
+
+        # id breaks ties between rows written in the same batch, which share
+        # a created_at
+        query = self._user_activities_query(user_id, activity_type).order_by(
+            desc(ActivityLog.created_at), desc(ActivityLog.id)
+        )
+        if before is not None:
+            # Compare against the cursor row's stored created_at rather than
+            # the bound datetime: SQLite keeps server_default timestamps as
+            # 'YYYY-MM-DD HH:MM:SS' text while the parameter binds with
+            # microseconds, so same-second rows would never sort past it.
+            # ``before`` only stands in if the cursor row has been deleted.
+            cursor_created_at = func.coalesce(
+                select(ActivityLog.created_at).where(
+                    ActivityLog.id == before_id,
+                    ActivityLog.user_id == user_id
+                ).scalar_subquery(),
+                before
+            )
+            query = query.filter(or_(
+                ActivityLog.created_at < cursor_created_at,
+                and_(
+                    ActivityLog.created_at == cursor_created_at,
+                    ActivityLog.id < before_id
+                )
+            ))
+
+        # One extra row tells whether another page follows
+        activities = query.limit(limit + 1).all()
+        has_more = len(activities) > limit
+        if has_more:
+            activities.pop()
+
+        return activities, has_more
+
     def get_activity_by_id(self, user_id: int, activity_id: int) -> Optional[ActivityLog]:
         """Get a specific activity by ID for a user."""
         return self.db.query(ActivityLog).filter(
@@ -82,17 +224,13 @@ class ActivityService:
 
         since_date = datetime.utcnow() - timedelta(days=days)
 
-        activities = self.db.query(ActivityLog).filter(
+        # Count per type in the database instead of loading every row
+        rows = self.db.query(ActivityLog.activity_type, func.count()).filter(
             ActivityLog.user_id == user_id,
             ActivityLog.created_at >= since_date
-        ).all()
-
-        summary = {}
-        for activity in activities:
-            activity_type = activity.activity_type
-            summary[activity_type] = summary.get(activity_type, 0) + 1
+        ).group_by(ActivityLog.activity_type).all()
 
-        return summary
+        return dict(rows)
 
     def cleanup_old_activities(self, user_id: int, days_to_keep: int = 365) -> int:
         """Clean up old activity logs (for data retention policies)."""
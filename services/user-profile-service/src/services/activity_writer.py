@@ -0,0 +1,231 @@
+"""Buffered background writer for activity log rows.
+
+Audit rows that don't have to be part of the request's own transaction
+(e.g. admin access logs) are buffered here and written by a background task
+in multi-row INSERT batches, so the request doesn't wait on a commit.
+Admin lookups of users that don't exist are only counted, and the counts
+are reported by the same task once per interval.
+"""
+
+import asyncio
+import logging
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from ..database import SessionLocal
+from .activity_service import ActivityService
+
+logger = logging.getLogger(__name__)
+
+# Flush when this many rows are buffered...
+LOG_BUFFER_SIZE = 256
+# ...and at least this often (seconds)
+LOG_BUFFER_TIME = 0.2
+# Rows beyond this many pending are dropped (and counted) rather than
+# blocking requests
+MAX_PENDING_ROWS = 20_000
+# Admin lookup misses are reported in aggregate this often (seconds)
+MISS_REPORT_INTERVAL = 60.0
+
+
+def _write_batch(rows: List[Dict[str, Any]]) -> int:
+    """Insert a batch of rows in one statement; returns the number written."""
+    with SessionLocal() as session:
+        activity_service = ActivityService(session)
+        try:
+            activity_service.log_activities(rows)
+            session.commit()
+            return len(rows)
+        except SQLAlchemyError:
+            session.rollback()
+
+        # One bad row (e.g. its user was deleted meanwhile) must not cost the
+        # rest of the batch, so retry row by row
+        written = 0
+        for row in rows:
+            try:
+                activity_service.log_activities([row])
+                session.commit()
+                written += 1
+            except SQLAlchemyError as e:
+                session.rollback()
+                logger.warning(
+                    "Dropped activity log row type=%s user_id=%s: %s",
+                    row.get("activity_type"),
+                    row.get("user_id"),
+                    type(e).__name__
+                )
+        return written
+
+
+class MissCounter:
+    """Per-admin counts of lookups that found no profile/preferences.
+
+    Misses are counted instead of logged row by row, so ID enumeration can't
+    bloat activity_logs (nor can a missing profile carry an activity row).
+    Safe to update from threadpool handlers.
+    """
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, admin_email: str, entity_type: str) -> None:
+        """Count one admin lookup that found nothing."""
+        with self._lock:
+            self._counts[admin_email, entity_type] += 1
+
+    def flush(self) -> List[Tuple[Tuple[str, str], int]]:
+        """Report and reset the counts; returns what was reported."""
+        with self._lock:
+            if not self._counts:
+                return []
+            counts, self._counts = self._counts, Counter()
+
+        reported = list(counts.items())
+        for (admin_email, entity_type), count in reported:
+            logger.warning(
+                "admin_access_miss admin=%s entity_type=%s count=%d",
+                admin_email,
+                entity_type,
+                count
+            )
+        return reported
+
+
+class ActivityWriter:
+    """Double-buffered activity log writer drained by a single background task.
+
+    Requests append to the filling buffer while the background task writes
+    the previous one. The two are swapped in one step on the event loop, so
+    a request never waits for a flush and needs no lock. The same task
+    reports the admin lookup miss counts every ``miss_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        buffer_size: int = LOG_BUFFER_SIZE,
+        buffer_time: float = LOG_BUFFER_TIME,
+        max_pending: int = MAX_PENDING_ROWS,
+        miss_interval: float = MISS_REPORT_INTERVAL
+    ):
+        self.buffer_size = buffer_size
+        self.buffer_time = buffer_time
+        self.max_pending = max_pending
+        self.miss_interval = miss_interval
+        self.dropped = 0
+        self.misses = MissCounter()
+        self._filling: List[Dict[str, Any]] = []
+        self._full: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Start the background writer on the running event loop."""
+        if self.running:
+            return
+        self._stopping = False
+        self._loop = asyncio.get_running_loop()
+        self._full = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="activity-writer")
+
+    async def stop(self) -> None:
+        """Write everything buffered so far, then stop the background writer."""
+        if not self.running:
+            return
+        self._stopping = True
+        self._full.set()
+        await self._task
+        self._task = None
+
+    def submit(self, db: Session, **row: Any) -> None:
+        """Buffer an activity log row (``log_activity`` keyword arguments).
+
+        Without a running writer (e.g. the app was not started through its
+        lifespan), the row is written and committed on ``db`` immediately.
+
+        Safe to call from sync handlers running in the threadpool: the row is
+        then handed to the event loop, which owns the buffers.
+        """
+        if not self.running:
+            ActivityService(db).log_activity(**row)
+            db.commit()
+            return
+
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+        if on_loop:
+            self._buffer(row)
+        else:
+            self._loop.call_soon_threadsafe(self._buffer, row)
+
+    def record_miss(self, admin_email: str, entity_type: str) -> None:
+        """Count an admin lookup that found nothing.
+
+        Without a running writer there is no task to report the counts, so
+        the miss is reported at once.
+        """
+        self.misses.record(admin_email, entity_type)
+        if not self.running:
+            self.misses.flush()
+
+    def _buffer(self, row: Dict[str, Any]) -> None:
+        filling = self._filling
+        if len(filling) >= self.max_pending:
+            self.dropped += 1
+            logger.warning(
+                "Activity log buffer full, dropped row type=%s (total dropped: %d)",
+                row.get("activity_type"),
+                self.dropped
+            )
+            return
+
+        filling.append(row)
+        if len(filling) == self.buffer_size:
+            # Wake the writer early instead of waiting out buffer_time
+            self._full.set()
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_miss_report = loop.time() + self.miss_interval
+        while True:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.buffer_time)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+
+            if self._filling:
+                # Swap buffers: requests keep appending to a fresh list while
+                # this one is flushed
+                flushing, self._filling = self._filling, []
+                for start in range(0, len(flushing), self.buffer_size):
+                    batch = flushing[start:start + self.buffer_size]
+                    try:
+                        await asyncio.to_thread(_write_batch, batch)
+                    except Exception:
+                        logger.exception("Failed to write %d activity log rows", len(batch))
+
+            if loop.time() >= next_miss_report:
+                self.misses.flush()
+                next_miss_report = loop.time() + self.miss_interval
+
+            if self._stopping and not self._filling:
+                # Report the last, partial interval too
+                self.misses.flush()
+                return
+
+
+# Shared writer, started and stopped with the application
+activity_writer = ActivityWriter()
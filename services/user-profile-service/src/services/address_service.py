@@ -1,25 +1,87 @@
 from datetime import datetime
-from typing import Optional, List
-from sqlalchemy.orm import Session
+from typing import Optional, List, Sequence
+import orjson
+from sqlalchemy import Row, select, text
+from sqlalchemy.orm import Session, raiseload
 from sqlalchemy.exc import IntegrityError
 
 from ..models.address import Address
 from ..schemas.address import AddressCreateRequest, AddressUpdateRequest
 from .activity_service import ActivityService
 
+# Address fields an update may set back to null
+_NULLABLE_UPDATE_FIELDS = frozenset({"address_line_2", "state_province", "label"})
+
+# Address table columns, in AddressResponse field order
+_ADDRESS_COLUMNS = tuple(Address.__table__.c)
+
+# A user's addresses as one JSON array built by PostgreSQL; json_agg keeps
+# the column (= AddressResponse field) order
+_ADDRESSES_JSON_SQL = text(f"""
+    SELECT coalesce(json_agg(a ORDER BY a.is_default DESC, a.created_at DESC), '[]')::text
+    FROM {Address.__tablename__} AS a
+    WHERE a.user_id = :user_id
+      AND (CAST(:address_type AS text) IS NULL OR a.address_type = :address_type)
+""")
+
 
 class AddressService:
+    # Built once per request by the address routes, so keep construction to a
+    # single slot assignment
+    __slots__ = ("db", "_activity_service")
+
     def __init__(self, db: Session):
         self.db = db
-        self.activity_service = ActivityService(db)
+        self._activity_service = None
+
+    @property
+    def activity_service(self) -> ActivityService:
+        """Activity logger, created on first use (only write paths log)."""
+        if self._activity_service is None:
+            self._activity_service = ActivityService(self.db)
+        return self._activity_service
 
     def get_user_addresses(self, user_id: int, address_type: Optional[str] = None) -> List[Address]:
         """Get all addresses for a user, optionally filtered by type."""
-        query = self.db.query(Address).filter(Address.user_id == user_id)
+        # Listings serialize column data only; raise instead of quietly
+        # issuing a SELECT per row if a relationship is ever touched
+        query = self.db.query(Address).options(raiseload("*")).filter(
+            Address.user_id == user_id
+        )
         if address_type:
             query = query.filter(Address.address_type == address_type)
         return query.order_by(Address.is_default.desc(), Address.created_at.desc()).all()
 
+    def list_user_addresses_core(self, user_id: int, address_type: Optional[str] = None) -> Sequence[Row]:
+        """Get a user's addresses as plain rows, without loading ORM instances.
+
+        Same filtering and ordering as ``get_user_addresses``, for read-only
+        listings that are serialized straight to the response.
+        """
+        table = Address.__table__
+        stmt = select(*_ADDRESS_COLUMNS).where(table.c.user_id == user_id)
+        if address_type:
+            stmt = stmt.where(table.c.address_type == address_type)
+        stmt = stmt.order_by(table.c.is_default.desc(), table.c.created_at.desc())
+        return self.db.execute(stmt).all()
+
+    def get_user_addresses_json(self, user_id: int, address_type: Optional[str] = None) -> bytes:
+        """Get a user's addresses as a JSON array in AddressResponse shape.
+
+        On PostgreSQL the array is built by the database in one query, with
+        no per-row work in Python. Other databases serialize the rows from
+        ``list_user_addresses_core``.
+        """
+        if self.db.get_bind().dialect.name == "postgresql":
+            result = self.db.execute(
+                _ADDRESSES_JSON_SQL,
+                {"user_id": user_id, "address_type": address_type or None}
+            ).scalar_one()
+            return result.encode()
+
+        rows = self.list_user_addresses_core(user_id, address_type)
+        return orjson.dumps([dict(row._mapping) for row in rows])
+
     def get_address_by_id(self, user_id: int, address_id: int) -> Optional[Address]:
         """Get a specific address by ID for a user."""
         return self.db.query(Address).filter(
@@ -37,14 +99,19 @@ class AddressService:
 
     def create_address(self, user_id: int, address_data: AddressCreateRequest, ip_address: Optional[str] = None, user_agent: Optional[str] = None, correlation_id: Optional[str] = None) -> Address:
         """Create a new address for a user."""
-        # If this is the first address of this type, make it default
-        existing_addresses = self.get_user_addresses(user_id, address_data.address_type)
-        if not existing_addresses:
-            address_data.is_default = True
-
-        # If setting as default, unset other defaults
         if address_data.is_default:
+            # Setting as default: unset other defaults (whether any exist
+            # doesn't matter, so skip the existence check)
             self._unset_default_addresses(user_id, address_data.address_type)
+        else:
+            # If this is the first address of this type, make it default;
+            # with no other addresses there is no default to unset
+            existing_address = self.db.query(Address.id).filter(
+                Address.user_id == user_id,
+                Address.address_type == address_data.address_type
+            ).first()
+            if existing_address is None:
+                address_data.is_default = True
 
         address = Address(
             user_id=user_id,
@@ -98,45 +165,22 @@ class AddressService:
         if not address:
             return None
 
-        # Store old values for activity log
-        old_values = {
-            "street_address": address.street_address,
-            "address_line_2": address.address_line_2,
-            "city": address.city,
-            "state_province": address.state_province,
-            "postal_code": address.postal_code,
-            "country": address.country,
-            "label": address.label
+        # Only the fields the client sent; null clears an optional field and
+        # is ignored for required ones
+        updates = {
+            field: value
+            for field, value in address_data.model_dump(exclude_unset=True).items()
+            if value is not None or field in _NULLABLE_UPDATE_FIELDS
         }
 
-        # Update fields only if provided
-        if address_data.street_address is not None:
-            address.street_address = address_data.street_address
-        if address_data.address_line_2 is not None:
-            address.address_line_2 = address_data.address_line_2
-        if address_data.city is not None:
-            address.city = address_data.city
-        if address_data.state_province is not None:
-            address.state_province = address_data.state_province
-        if address_data.postal_code is not None:
-            address.postal_code = address_data.postal_code
-        if address_data.country is not None:
-            address.country = address_data.country
-        if address_data.label is not None:
-            address.label = address_data.label
-
-        address.updated_at = datetime.utcnow()
-
-        # Store new values for activity log
-        new_values = {
-            "street_address": address.street_address,
-            "address_line_2": address.address_line_2,
-            "city": address.city,
-            "state_province": address.state_province,
-            "postal_code": address.postal_code,
-            "country": address.country,
-            "label": address.label
-        }
+        # Store old and new values of the updated fields for activity log
+        old_values = {field: getattr(address, field) for field in updates}
+        new_values = updates
+
+        if updates:
+            for field, value in updates.items():
+                setattr(address, field, value)
+            address.updated_at = datetime.utcnow()
 
         try:
             # Log the activity
@@ -192,19 +236,26 @@ class AddressService:
                 }
             )
 
-            # If deleting the default address, set another address as default
-            if address.is_default:
-                remaining_addresses = self.db.query(Address).filter(
-                    Address.user_id == user_id,
-                    Address.address_type == address.address_type,
-                    Address.id != address_id
-                ).first()
-
-                if remaining_addresses:
-                    remaining_addresses.is_default = True
-                    remaining_addresses.updated_at = datetime.utcnow()
+            was_default = address.is_default
+            address_type = address.address_type
 
+            # Delete first: the unique default index would reject promoting
+            # another address while this one is still the default
             self.db.delete(address)
+            self.db.flush()
+
+            # If deleting the default address, promote the most recent
+            # remaining one in a single UPDATE (no-op if none remain)
+            if was_default:
+                newest = select(Address.id).where(
+                    Address.user_id == user_id,
+                    Address.address_type == address_type
+                ).order_by(Address.created_at.desc(), Address.id.desc()).limit(1).scalar_subquery()
+                self.db.query(Address).filter(Address.id == newest).update(
+                    {"is_default": True, "updated_at": datetime.utcnow()},
+                    synchronize_session=False
+                )
+
             self.db.commit()
             return True
 
@@ -222,7 +273,13 @@ class AddressService:
             return address  # Already default
 
         try:
-            # Unset other default addresses of the same type
+            # Unset other default addresses of the same type. This must run
+            # as its own statement before the new default is written: the
+            # partial unique index on defaults is checked row by row, so a
+            # combined swap (CASE update or writable CTE) can fail depending
+            # on the order rows are visited. The bulk UPDATE is sent
+            # immediately, and the flag change below goes out with the
+            # activity log insert at commit.
             self._unset_default_addresses(user_id, address.address_type)
 
             # Set this address as default
@@ -1,12 +1,14 @@
 import httpx
 import jwt
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, Tuple
 from fastapi import HTTPException, status
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections held open to the auth service
+AUTH_HTTP_LIMITS = httpx.Limits(max_connections=20, max_keepalive_connections=4)
 
 class AuthService:
     def __init__(self, auth_service_url: str, jwt_secret_key: str, jwt_algorithm: str = "HS256"):
@@ -14,9 +16,34 @@ class AuthService:
         self.jwt_secret_key = jwt_secret_key
         self.jwt_algorithm = jwt_algorithm
         self.timeout = 5.0  # 5 second timeout for auth service calls
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared HTTP client, so calls reuse pooled keep-alive connections.
+
+        Created on first use inside the running event loop; closed by
+        ``aclose`` at application shutdown.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.auth_service_url,
+                timeout=self.timeout,
+                limits=AUTH_HTTP_LIMITS
+            )
+        return self._client
 
-    def verify_token_local(self, token: str) -> Optional[Dict[str, Any]]:
-        """Verify JWT token locally using the shared secret."""
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _decode_local(self, token: str) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Decode and verify a token locally.
+
+        Returns the payload (or None) and why: "ok", "expired" or "invalid".
+        """
         try:
             payload = jwt.decode(
                 token,
@@ -26,41 +53,44 @@ class AuthService:
 
             # Check token expiration
             exp = payload.get('exp')
-            if exp and datetime.fromtimestamp(exp, tz=timezone.utc) < datetime.now(tz=timezone.utc):
+            if exp and exp < time.time():
                 logger.warning("Token has expired")
-                return None
+                return None, "expired"
 
-            return payload
+            return payload, "ok"
 
         except jwt.ExpiredSignatureError:
             logger.warning("Token has expired")
-            return None
+            return None, "expired"
         except jwt.InvalidTokenError as e:
             logger.warning(f"Invalid token: {str(e)}")
-            return None
+            return None, "invalid"
         except Exception as e:
             logger.error(f"Token verification error: {str(e)}")
-            return None
+            return None, "invalid"
+
+    def verify_token_local(self, token: str) -> Optional[Dict[str, Any]]:
+        """Verify JWT token locally using the shared secret."""
+        return self._decode_local(token)[0]
 
     async def verify_token_remote(self, token: str) -> Optional[Dict[str, Any]]:
         """Verify token with the auth service (fallback method)."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    f"{self.auth_service_url}/auth/verify",
-                    headers={"Authorization": f"Bearer {token}"}
-                )
-
-                if response.status_code == 200:
-                    data = response.json()
-                    return {
-                        "user_id": data.get("user_id"),
-                        "email": data.get("email"),
-                        "verified": True
-                    }
-                else:
-                    logger.warning(f"Auth service returned status {response.status_code}")
-                    return None
+            response = await self.client.get(
+                "/auth/verify",
+                headers={"Authorization": f"Bearer {token}"}
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                return {
+                    "user_id": data.get("user_id"),
+                    "email": data.get("email"),
+                    "verified": True
+                }
+            else:
+                logger.warning(f"Auth service returned status {response.status_code}")
+                return None
 
         except httpx.TimeoutException:
             logger.error("Auth service timeout")
@@ -72,16 +102,26 @@ class AuthService:
     async def verify_token(self, token: str) -> Dict[str, Any]:
         """Verify token using local verification with remote fallback."""
         # Try local verification first
-        payload = self.verify_token_local(token)
+        payload, reason = self._decode_local(token)
 
         if payload:
             return {
                 "user_id": payload.get("user_id"),
                 "email": payload.get("email"),
                 "verified": True,
-                "method": "local"
+                "method": "local",
+                "exp": payload.get("exp")
             }
 
+        # PyJWT only reports expiry once the signature checked out, so the
+        # token is ours and the auth service would reject it too. Any other
+        # failure may be a token signed with a key we don't hold.
+        if reason == "expired":
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid or expired token"
+            )
+
         # Fallback to remote verification
         logger.info("Local token verification failed, trying remote verification")
         payload = await self.verify_token_remote(token)
@@ -125,8 +165,7 @@ class AuthService:
     async def check_auth_service_health(self) -> bool:
         """Check if the auth service is healthy."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(f"{self.auth_service_url}/health")
-                return response.status_code == 200
+            response = await self.client.get("/health")
+            return response.status_code == 200
         except Exception:
             return False
\ No newline at end of file
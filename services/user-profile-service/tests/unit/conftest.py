@@ -0,0 +1,90 @@
+"""Fixtures for unit tests against an in-memory SQLite database."""
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.models import Base, UserProfile
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with the full schema, shared across threads."""
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool
+    )
+
+    @event.listens_for(engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record) -> None:
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    """Session factory bound to the test engine."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture
+def db(session_factory) -> Session:
+    """Database session for a single test."""
+    session = session_factory()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def profile(db) -> UserProfile:
+    """A committed profile for user 1."""
+    profile = UserProfile(user_id=1, first_name="Test", last_name="User")
+    db.add(profile)
+    db.commit()
+    return profile
+
+
+@pytest.fixture
+def statements(engine):
+    """SQL statements executed on the test engine, captured per test."""
+    captured = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        captured.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    yield captured
+    event.remove(engine, "before_cursor_execute", _capture)
+
+
+@pytest.fixture
+def client(session_factory, profile):
+    """TestClient for the user routes, authenticated as user 1."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from src.database import get_db
+    from src.dependencies import get_current_user
+    from src.routers import activity, addresses
+
+    app = FastAPI()
+    app.include_router(addresses.router)
+    app.include_router(activity.router)
+
+    def _get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = _get_db
+    app.dependency_overrides[get_current_user] = lambda: {"user_id": 1, "email": "user@example.com"}
+    return TestClient(app)
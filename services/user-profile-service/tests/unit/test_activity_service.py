@@ -0,0 +1,71 @@
+"""Unit tests for ActivityService keyset pagination."""
+
+from datetime import datetime
+
+import pytest
+
+from src.services.activity_service import ActivityService
+
+
+@pytest.fixture
+def service(db, profile):
+    """ActivityService with eight activities for user 1.
+
+    They are written in one INSERT, so every row shares a created_at, as
+    rows from one activity_writer batch do.
+    """
+    service = ActivityService(db)
+    service.log_activities(
+        {"user_id": 1, "activity_type": "profile_viewed", "description": f"view {n}"}
+        for n in range(8)
+    )
+    db.commit()
+    return service
+
+
+def _page_ids(service, **cursor):
+    activities, has_more = service.get_user_activities_page(user_id=1, limit=3, **cursor)
+    return [activity.id for activity in activities], has_more, activities
+
+
+def test_keyset_pages_walk_every_row_once(service):
+    """Following next_cursor visits every row, newest first, then stops."""
+    seen = []
+    cursor = {}
+    while True:
+        ids, has_more, activities = _page_ids(service, **cursor)
+        seen.extend(ids)
+        if not has_more:
+            break
+        last = activities[-1]
+        cursor = {"before": last.created_at, "before_id": last.id}
+
+    assert seen == list(range(8, 0, -1))
+
+
+def test_keyset_second_page_advances(service):
+    """The second page starts right after the first page's last row."""
+    first, has_more, activities = _page_ids(service)
+    last = activities[-1]
+    second, _, _ = _page_ids(service, before=last.created_at, before_id=last.id)
+
+    assert first == [8, 7, 6]
+    assert has_more is True
+    assert second == [5, 4, 3]
+
+
+def test_keyset_cursor_microseconds_do_not_matter(service):
+    """A cursor timestamp parsed back from JSON still pages by id."""
+    _, _, activities = _page_ids(service)
+    last = activities[-1]
+    before = datetime.fromisoformat(last.created_at.isoformat()).replace(microsecond=0)
+
+    ids, _, _ = _page_ids(service, before=before, before_id=last.id)
+
+    assert ids == [5, 4, 3]
+
+
+def test_keyset_requires_before_id(service):
+    """A before cursor without before_id would skip rows sharing its timestamp."""
+    with pytest.raises(ValueError):
+        service.get_user_activities_page(user_id=1, before=datetime.utcnow())
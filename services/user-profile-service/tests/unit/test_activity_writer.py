@@ -0,0 +1,162 @@
+"""Unit tests for the buffered ActivityWriter."""
+
+import asyncio
+import logging
+
+import pytest
+
+from src.models import ActivityLog
+from src.services import activity_writer as activity_writer_module
+from src.services.activity_writer import ActivityWriter
+
+
+@pytest.fixture
+def writer_db(monkeypatch, session_factory, profile):
+    """Point the writer's batch sessions at the test database."""
+    monkeypatch.setattr(activity_writer_module, "SessionLocal", session_factory)
+    return session_factory
+
+
+def _row(n: int, user_id: int = 1) -> dict:
+    return {"user_id": user_id, "activity_type": "admin_access", "description": f"access {n}"}
+
+
+def _descriptions(session_factory) -> list:
+    with session_factory() as session:
+        return [
+            description
+            for (description,) in session.query(ActivityLog.description).order_by(ActivityLog.id)
+        ]
+
+
+async def test_stop_drains_buffered_rows(writer_db, db):
+    """Rows submitted on the event loop are all written by stop()."""
+    writer = ActivityWriter(buffer_size=2, buffer_time=3600)
+    await writer.start()
+    for n in range(5):
+        writer.submit(db, **_row(n))
+
+    await writer.stop()
+
+    assert not writer.running
+    assert _descriptions(writer_db) == [f"access {n}" for n in range(5)]
+
+
+async def test_submit_from_worker_thread(writer_db, db):
+    """Threadpool handlers hand rows to the event loop, which writes them."""
+    writer = ActivityWriter(buffer_time=3600)
+    await writer.start()
+
+    def handler():
+        for n in range(3):
+            writer.submit(db, **_row(n))
+
+    await asyncio.to_thread(handler)
+    # Let the call_soon_threadsafe callbacks run before stopping
+    await asyncio.sleep(0)
+    await writer.stop()
+
+    assert _descriptions(writer_db) == ["access 0", "access 1", "access 2"]
+
+
+async def test_full_buffer_flushes_before_buffer_time(writer_db, db):
+    """Reaching buffer_size wakes the writer instead of waiting out the timer."""
+    writer = ActivityWriter(buffer_size=2, buffer_time=3600)
+    await writer.start()
+    try:
+        writer.submit(db, **_row(0))
+        writer.submit(db, **_row(1))
+        for _ in range(50):
+            if len(_descriptions(writer_db)) == 2:
+                break
+            await asyncio.sleep(0.01)
+
+        assert _descriptions(writer_db) == ["access 0", "access 1"]
+    finally:
+        await writer.stop()
+
+
+async def test_failed_row_does_not_cost_the_batch(writer_db, db, caplog):
+    """A row the database rejects is dropped; the rest of its batch is kept."""
+    writer = ActivityWriter(buffer_time=3600)
+    await writer.start()
+    writer.submit(db, **_row(0))
+    # No profile for user 999, so the foreign key rejects this row
+    writer.submit(db, **_row(1, user_id=999))
+    writer.submit(db, **_row(2))
+
+    with caplog.at_level(logging.WARNING):
+        await writer.stop()
+
+    assert _descriptions(writer_db) == ["access 0", "access 2"]
+    assert any("user_id=999" in record.getMessage() for record in caplog.records)
+
+
+async def test_rows_beyond_max_pending_are_dropped(writer_db, db):
+    """A full buffer drops and counts rows instead of blocking the caller."""
+    writer = ActivityWriter(buffer_size=10, buffer_time=3600, max_pending=2)
+    await writer.start()
+    for n in range(3):
+        writer.submit(db, **_row(n))
+
+    await writer.stop()
+
+    assert writer.dropped == 1
+    assert _descriptions(writer_db) == ["access 0", "access 1"]
+
+
+def test_submit_without_running_writer_commits_at_once(writer_db, db):
+    """Outside the app lifespan, rows are written on the caller's session."""
+    writer = ActivityWriter()
+
+    writer.submit(db, **_row(0))
+
+    assert _descriptions(writer_db) == ["access 0"]
+
+
+def _miss_reports(caplog):
+    return [r.getMessage() for r in caplog.records if r.getMessage().startswith("admin_access_miss")]
+
+
+async def test_misses_reported_each_interval(caplog):
+    """Counts are reported by the writer task without waiting for a later miss."""
+    writer = ActivityWriter(buffer_time=0.01, miss_interval=0.05)
+    await writer.start()
+    try:
+        with caplog.at_level(logging.WARNING):
+            for _ in range(3):
+                writer.record_miss("admin@example.com", "profile")
+            await asyncio.sleep(0.2)
+
+            assert _miss_reports(caplog) == [
+                "admin_access_miss admin=admin@example.com entity_type=profile count=3"
+            ]
+    finally:
+        await writer.stop()
+
+
+async def test_stop_reports_last_interval(caplog):
+    """Misses counted since the last report are flushed on shutdown."""
+    writer = ActivityWriter(miss_interval=3600)
+    await writer.start()
+    writer.record_miss("admin@example.com", "preferences")
+    writer.record_miss("admin@example.com", "preferences")
+
+    with caplog.at_level(logging.WARNING):
+        await writer.stop()
+
+    assert _miss_reports(caplog) == [
+        "admin_access_miss admin=admin@example.com entity_type=preferences count=2"
+    ]
+
+
+def test_miss_reported_at_once_without_running_writer(caplog):
+    """With no writer task, a miss is reported immediately."""
+    writer = ActivityWriter()
+
+    with caplog.at_level(logging.WARNING):
+        writer.record_miss("admin@example.com", "profile")
+
+    assert _miss_reports(caplog) == [
+        "admin_access_miss admin=admin@example.com entity_type=profile count=1"
+    ]
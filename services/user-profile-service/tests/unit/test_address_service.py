@@ -0,0 +1,90 @@
+"""Unit tests for AddressService default-address handling."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models import Address
+from src.services.address_service import AddressService
+
+_BASE_TIME = datetime(2026, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def service(db, profile) -> AddressService:
+    return AddressService(db)
+
+
+def _add_address(db, address_type: str, minutes: int, is_default: bool = False) -> int:
+    """Add an address created ``minutes`` after a fixed time; returns its id."""
+    address = Address(
+        user_id=1,
+        address_type=address_type,
+        street_address=f"{minutes} Main St",
+        city="San Francisco",
+        postal_code="94105",
+        country="US",
+        is_default=is_default,
+        created_at=_BASE_TIME + timedelta(minutes=minutes)
+    )
+    db.add(address)
+    db.commit()
+    return address.id
+
+
+def _defaults(db) -> dict:
+    rows = db.query(Address.address_type, Address.id).filter(Address.is_default.is_(True)).all()
+    return dict(rows)
+
+
+def test_deleting_default_promotes_newest_remaining(db, service, statements):
+    """The newest remaining address of the type becomes the default."""
+    default_id = _add_address(db, "shipping", 0, is_default=True)
+    _add_address(db, "shipping", 1)
+    newest_id = _add_address(db, "shipping", 2)
+    _add_address(db, "shipping", -10)  # oldest
+    billing_id = _add_address(db, "billing", 5, is_default=True)
+    statements.clear()
+
+    assert service.delete_address(1, default_id) is True
+
+    db.expire_all()
+    assert _defaults(db) == {"shipping": newest_id, "billing": billing_id}
+    assert sum(s.lstrip().upper().startswith("UPDATE") for s in statements) == 1
+
+
+def test_promotion_breaks_created_at_ties_by_id(db, service):
+    """Addresses created in the same second promote the later-inserted one."""
+    default_id = _add_address(db, "shipping", 0, is_default=True)
+    _add_address(db, "shipping", 1)
+    later_id = _add_address(db, "shipping", 1)
+
+    service.delete_address(1, default_id)
+
+    db.expire_all()
+    assert _defaults(db) == {"shipping": later_id}
+
+
+def test_deleting_last_address_of_type_is_a_noop_update(db, service):
+    """With no address of the type left, nothing is promoted."""
+    shipping_id = _add_address(db, "shipping", 0, is_default=True)
+    billing_id = _add_address(db, "billing", 1, is_default=True)
+
+    assert service.delete_address(1, shipping_id) is True
+
+    db.expire_all()
+    assert _defaults(db) == {"billing": billing_id}
+    assert db.query(Address).filter(Address.address_type == "shipping").count() == 0
+
+
+def test_deleting_non_default_keeps_default(db, service, statements):
+    """Deleting another address leaves the default alone and skips the UPDATE."""
+    default_id = _add_address(db, "shipping", 0, is_default=True)
+    other_id = _add_address(db, "shipping", 1)
+    statements.clear()
+
+    assert service.delete_address(1, other_id) is True
+
+    db.expire_all()
+    assert _defaults(db) == {"shipping": default_id}
+    assert not any(s.lstrip().upper().startswith("UPDATE") for s in statements)
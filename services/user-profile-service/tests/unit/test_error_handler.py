@@ -0,0 +1,34 @@
+"""Unit tests for the validation error handler."""
+
+import warnings
+
+import orjson
+from fastapi.exceptions import RequestValidationError
+from starlette.requests import Request
+
+from src.middleware.error_handler import validation_exception_handler
+
+
+def _request() -> Request:
+    return Request({"type": "http", "method": "POST", "path": "/profiles", "headers": []})
+
+
+async def test_validation_errors_serialize_without_warnings():
+    """Details match the declared ValidationErrorDetail type when dumped."""
+    exc = RequestValidationError([
+        {"loc": ("body", "phone"), "msg": "Invalid phone number", "input": "abc"},
+        {"loc": ("body", "date_of_birth"), "msg": "Field required"},
+    ])
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings("error", message="Pydantic serializer warnings")
+        response = await validation_exception_handler(_request(), exc)
+
+    body = orjson.loads(response.body)
+    assert response.status_code == 422
+    assert body["error"] == "Validation failed"
+    assert body["message"] == "Validation failed for 2 field(s)"
+    assert body["validation_errors"] == [
+        {"field": "body -> phone", "message": "Invalid phone number", "value": "abc"},
+        {"field": "body -> date_of_birth", "message": "Field required", "value": None},
+    ]
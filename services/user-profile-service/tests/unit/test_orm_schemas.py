@@ -0,0 +1,51 @@
+"""Unit tests for building response models from database rows."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.config import get_settings
+from src.models import Address
+from src.schemas.address import AddressResponse
+from src.schemas.orm import from_orm_trusted
+
+
+@pytest.fixture
+def address(db, profile) -> Address:
+    """A committed shipping address for user 1."""
+    address = Address(
+        user_id=1,
+        address_type="shipping",
+        street_address="123 Main St",
+        city="San Francisco",
+        postal_code="94105",
+        country="US",
+        is_default=True
+    )
+    db.add(address)
+    db.commit()
+    return address
+
+
+@pytest.fixture
+def untrusted(monkeypatch):
+    """Turn trust_orm_responses off for one test."""
+    monkeypatch.setattr(get_settings(), "trust_orm_responses", False)
+
+
+def test_trusted_rows_skip_validation(address):
+    """With the flag on, a row's values are taken as they are."""
+    address.city = None
+
+    response = from_orm_trusted(AddressResponse, address)
+
+    assert response.city is None
+    assert response.street_address == "123 Main St"
+
+
+def test_untrusted_rows_are_validated(address, untrusted):
+    """With the flag off, rows go through the response model's validation."""
+    assert from_orm_trusted(AddressResponse, address).id == address.id
+
+    address.city = None
+    with pytest.raises(ValidationError):
+        from_orm_trusted(AddressResponse, address)
@@ -0,0 +1,28 @@
+"""Unit tests for ProfileService query behaviour."""
+
+from src.schemas.profile import ProfileResponse, ProfileUpdateRequest
+from src.services.profile_service import ProfileService
+
+
+def test_get_profile_is_one_query(db, profile, statements):
+    """Loading and serializing a profile issues a single SELECT."""
+    db.expire_all()
+    statements.clear()
+
+    loaded = ProfileService(db).get_profile_by_user_id(1)
+    ProfileResponse.model_validate(loaded)
+
+    assert len(statements) == 1
+
+
+def test_update_profile_response_needs_no_extra_select(db, profile, statements):
+    """The refreshed profile serializes without loading any column separately."""
+    statements.clear()
+
+    updated = ProfileService(db).update_profile(1, ProfileUpdateRequest(first_name="New"))
+    ProfileResponse.model_validate(updated)
+
+    selects = [s for s in statements if s.lstrip().upper().startswith("SELECT")]
+    # The lookup before the update, then one refresh after commit
+    assert len(selects) == 2
+    assert updated.first_name == "New"
@@ -0,0 +1,36 @@
+"""Unit tests for address and activity route responses."""
+
+from src.schemas.activity import ActivityListResponse
+from src.schemas.address import AddressResponse
+
+_ADDRESS = {
+    "address_type": "shipping",
+    "street_address": "123 Main St",
+    "city": "San Francisco",
+    "postal_code": "94105",
+    "country": "US",
+}
+
+
+def test_address_routes_serialize_through_response_model(client):
+    """Created and listed addresses have the AddressResponse shape."""
+    created = client.post("/addresses", json=_ADDRESS)
+    listed = client.get("/addresses")
+
+    assert created.status_code == 201
+    assert created.json()["is_default"] is True
+    assert listed.status_code == 200
+    assert listed.json() == [AddressResponse.model_validate(created.json()).model_dump(mode="json")]
+
+
+def test_activity_list_serializes_through_response_model(client):
+    """The activity list matches ActivityListResponse, including has_more."""
+    client.post("/addresses", json=_ADDRESS)
+
+    response = client.get("/activity", params={"limit": 1})
+
+    body = ActivityListResponse.model_validate(response.json())
+    assert response.status_code == 200
+    assert [a.activity_type for a in body.activities] == ["address_created"]
+    assert body.total == 1
+    assert body.has_more is False